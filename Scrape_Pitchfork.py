@@ -1,10 +1,38 @@
 import time
-start = time.time()
+import threading
 
-import subprocess
+import Scrape_Pitchfork_Sitemap as reviews
+import Scrape_Pitchfork_Unreachable_URLS as unreachable
 
-subprocess.run(["python", "Scrape_Pitchfork_Sitemap.py"], check=True)
-subprocess.run(["python", "Scrape_Pitchfork_Unreachable_URLS.py"], check=True)
+from scraper import general
 
-end = time.time()
-print(f"\nExecution Time: {(end - start)/60:.2f} minutes")
\ No newline at end of file
+def main():
+    start = time.time()
+    general.setup_logging()
+
+    # Every stage runs in this process, so they share the HTTP keep-alive pool,
+    # the in-memory ID dictionaries and the database writer thread
+    hard_reset = True
+    get_connection = reviews.setup_database(hard_reset)
+    with reviews.bulk_load(get_connection, hard_reset):
+        reviews.scrape_sitemap(get_connection)
+        reviews.scrape_album_reviews(get_connection)
+
+        # Author bios and the albums missing from the sitemap don't depend on each other
+        stages = [
+            threading.Thread(target=reviews.scrape_author_bios, args=(get_connection,)),
+            threading.Thread(target=unreachable.scrape_unreachable_urls, args=(get_connection,)),]
+        for stage in stages:
+            stage.start()
+        for stage in stages:
+            stage.join()
+
+    reviews.execute_sql_scripts(get_connection, analyze=not hard_reset)
+
+    end = time.time()
+    print(f"\nExecution Time: {(end - start)/60:.2f} minutes")
+
+# The parse pool spawns worker processes, which re-import this script:
+# without the guard every worker would rerun the whole pipeline
+if __name__ == '__main__':
+    main()
@@ -1,90 +1,115 @@
-import os
-import pandas as pd
+import logging
 import datetime as dt
-import concurrent.futures 
 
 from pathlib import Path
-from scraper import db, sitemap, album, author
+from functools import partial
+from contextlib import closing, nullcontext
+from scraper import db, general, sitemap, album, author
 
-def multithread_scrape_year(year):
+logger = logging.getLogger(__name__)
+
+def multithread_scrape_year(get_connection, year):
     try:
-        print(f'Scraping year {year}')
+        logger.info('Scraping year %s', year)
         sitemap.scrape_sitemap_year(get_connection, year, timeout=2)
-        print(f"Completed scraping for {year}")
+        logger.info('Completed scraping for %s', year)
     except Exception as e:
-        print(f"Error scraping {year}: {e}")
+        logger.error('Error scraping %s: %s', year, e)
 
-def multithread_scrape_album(url_tuple):
+def multithread_scrape_album(get_connection, url_tuple):
+    # fetch_url already retries with exponential backoff (and gives up right away on a 404/410),
+    # so a failed page isn't retried again here
     try:
-        print(f'Scraping album {url_tuple[1]}')
-        album.scrape_album_review(get_connection, *url_tuple, timeout=2)
+        logger.info('Scraping album %s', url_tuple[1])
+        scraped = album.scrape_album_review(get_connection, *url_tuple, timeout=2)
     except Exception as e:
-        print(f"Error scraping {url_tuple[1]}: {e}")
+        # Re-raised, so the url is reported as unreached instead of silently dropped
+        logger.error('Error scraping %s: %s', url_tuple[1], e)
+        raise
+    if not scraped:
+        # Raising hands the url back to execute_multi_thread_func as a failed task
+        raise ConnectionError(f"Couldn't reach {url_tuple[1]}")
 
-def multithread_scrape_author(info):
-    a, id, u = info
+def multithread_scrape_author(get_connection, info):
+    id, u, a = info
     try:
-        print(f'Scraping author {a} inside {u}')
+        logger.info('Scraping author %s inside %s', a, u)
         author.scrape_authors_page(get_connection, *info, timeout=2)
     except Exception as e:
-        print(f"Error scraping {a}: {e}")
-
-def execute_multi_thread_func(func, params_list):
-    with concurrent.futures.ThreadPoolExecutor(max_workers=int(os.cpu_count()*2.5)) as executor:
-        executor.map(func, params_list)
-
-#Set up database
-filename = dt.datetime.now().strftime('Pitchfork_Album_Reviews_%Y_%m_%d.db')
-get_connection = db.initialize_database(filename, filepath='data', hard_reset=True)
-
-# Scrape Sitemap
-current_year = dt.datetime.now().year
-execute_multi_thread_func(multithread_scrape_year, list(range(1999, current_year + 1 )))
+        logger.error('Error scraping %s: %s', a, e)
 
-#Scrape Album Reviews
+# Both work lists leave out the pages already in the database (anti-joins), 
+# so a run on an existing database only scrapes what is missing
 query_review_album_urls = """
-SELECT url_id, url 
-FROM urls 
-WHERE url LIKE '%/reviews/albums/%'
-"""
-
-query_failed_urls = """
-SELECT url_id, url
-FROM urls u 
-WHERE 
-   url LIKE '%/reviews/albums/%' AND
-   u.url_id IN (
-   SELECT se.url_id 
-   FROM scraping_events se 
-   WHERE process = "Couldn't stablish connection")
+SELECT u.url_id, u.url 
+FROM urls u
+WHERE u.url LIKE '%/reviews/albums/%'
+AND NOT EXISTS (SELECT 1 FROM reviews r WHERE r.url_id = CAST(u.url_id AS TEXT)) -- reviews.url_id is a TEXT column
 """
 
 query_author_bio_pages = """
-SELECT a.author_id, u.url_id, u.url
+SELECT u.url_id, u.url, a.author_id
 FROM authors a
 JOIN urls u ON a.url_id = u.url_id
+WHERE NOT EXISTS (SELECT 1 FROM author_bios b WHERE b.author_id = a.author_id)
 """
 
-urls = pd.read_sql(query_review_album_urls, get_connection(), index_col='url_id')['url']
-execute_multi_thread_func(multithread_scrape_album, [(i,v) for i,v in urls.items()])
-
-#Normally there are 0 failed urls after the first attempt. But just to be sure
-retries = 10
-failed_album_urls = pd.read_sql(query_failed_urls, get_connection(), index_col='url_id')['url']
-while len(failed_album_urls) and (retries > 0):
-    execute_multi_thread_func(multithread_scrape_album, [(i,v) for i,v in failed_album_urls.items()])
-    failed_album_urls = pd.read_sql(query_failed_urls, get_connection(), index_col='url_id')['url']
-    retries -= 1
-
-#Scrape author's Biography page
-authors = pd.read_sql(query_author_bio_pages, get_connection(), index_col='author_id')
-execute_multi_thread_func(multithread_scrape_author, [(row.url_id, row.url, author_id) for author_id, row in authors.iterrows()])
-
-#Execute the .sql scripts in the /sql_scripts folder
-sql_scripts_folder = Path.cwd() / 'sql_scripts'
-
-for script in sql_scripts_folder.iterdir():
-    if script.suffix.lower() == '.sql': 
-        if 'Create Tables' in script.name:
-            continue
-        db.execute_script(get_connection, script)
+def setup_database(hard_reset=True):
+    # hard_reset=False resumes today's database instead of starting from scratch
+    filename = dt.datetime.now().strftime('Pitchfork_Album_Reviews_%Y_%m_%d.db')
+    return db.initialize_database(filename, filepath='data', hard_reset=hard_reset)
+
+def bulk_load(get_connection, hard_reset=True):
+    # A database created from scratch starts empty: its indexes are dropped while scraping 
+    # and built once at the end, instead of being updated on every insert
+    return db.bulk_load_context(get_connection) if hard_reset else nullcontext()
+
+def scrape_sitemap(get_connection):
+    current_year = dt.datetime.now().year
+    general.execute_multi_thread_func(partial(multithread_scrape_year, get_connection), list(range(1999, current_year + 1 )))
+
+def scrape_album_reviews(get_connection):
+    db.flush() # Wait for the writer thread to commit every url found in the sitemap
+    with closing(get_connection(read_only=True)) as con:
+        urls = con.execute(query_review_album_urls).fetchall() # [(url_id, url), ...]
+    # The threads download the pages while a pool of processes parses them
+    album.start_parse_pool()
+    try:
+        # The urls still unreachable are known in memory, no need to query scraping_events for them
+        unreached = general.execute_multi_thread_func(partial(multithread_scrape_album, get_connection), urls)
+    finally:
+        album.stop_parse_pool()
+    print(f'{len(urls) - len(unreached)} of {len(urls)} album reviews scraped')
+    return unreached
+
+def scrape_author_bios(get_connection):
+    db.flush()
+    with closing(get_connection(read_only=True)) as con:
+        authors = con.execute(query_author_bio_pages).fetchall() # [(url_id, url, author_id), ...]
+    general.execute_multi_thread_func(partial(multithread_scrape_author, get_connection), authors)
+
+def execute_sql_scripts(get_connection, analyze=True):
+    #Execute the .sql scripts in the /sql_scripts folder
+    db.flush()
+    if analyze: # bulk_load already refreshed the planner statistics on hard-reset runs
+        db.execute_command(get_connection, 'ANALYZE;')
+    sql_scripts_folder = Path.cwd() / 'sql_scripts'
+
+    for script in sql_scripts_folder.iterdir():
+        if script.suffix.lower() == '.sql': 
+            if 'Create Tables' in script.name:
+                continue
+            db.execute_script(get_connection, script)
+
+def main():
+    general.setup_logging()
+    hard_reset = True
+    get_connection = setup_database(hard_reset)
+    with bulk_load(get_connection, hard_reset):
+        scrape_sitemap(get_connection)
+        scrape_album_reviews(get_connection)
+        scrape_author_bios(get_connection)
+    execute_sql_scripts(get_connection, analyze=not hard_reset)
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,80 @@
+import re
+import sys
 import json
-import traceback
+import atexit
+import threading
+import multiprocessing
+import datetime as dt
 
 from dateutil import parser
-from bs4 import BeautifulSoup
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
 
 from . import db
 from . import general
 from . import globals as g
 from .types import *
 from typing import Dict, Tuple, Any, Optional, List, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# orjson is optional: it parses the (large) preloaded state several times faster than `json`
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 __all__ = [
 'extract_json_preload_data', 'extract_json_linked_data_album'
 'scrape_review_data', 'scrape_authors_data', 
 'scrape_albums_data', 'scrape_artists_data', 
 'scrape_entities_data', 'scrape_keywords_data', 
-'scrape_json_data', 'scrape_section', 'scrape_album_review', ]
+'scrape_json_data', 'extract_json_data', 'scrape_section', 
+'extract_album_review_rows', 'scrape_album_review', 'parse_review_page', 
+'build_album_review_rows', 'start_parse_pool', 'stop_parse_pool', ]
 
 ## Album Review Scraping
-def extract_json_preload_data(soup:Optional[BeautifulSoup]) -> Optional[Dict[str,Any]]:
+# Author and artist paths in the JSON are relative to the site (authors' start with '/', artists' don't)
+PITCHFORK_URL = 'https://pitchfork.com'
+PITCHFORK_URL_SLASH = PITCHFORK_URL + '/'
+
+# Everything scraped from a review page lives in <script> tags (the preloaded state and the JSON-LD),
+# so the rest of the page isn't built into the soup
+SCRIPT_STRAINER = SoupStrainer('script')
+
+# The preloaded state is a JSON object assigned in its own <script>: `window.__PRELOADED_STATE__ = {...};</script>`
+PRELOADED_STATE_MARKER = b'window.__PRELOADED_STATE__'
+PRELOADED_STATE_REGEX = re.compile(rb'window\.__PRELOADED_STATE__\s*=\s*(\{.*?\})\s*;?\s*</script>', re.DOTALL)
+# Fallback when the regex above misses: finds the <script> in the soup, matched by BeautifulSoup's regex path
+PRELOADED_STATE_SCRIPT_REGEX = re.compile(r'window\.__PRELOADED_STATE__')
+
+# The JSON-LD is queried straight on lxml's tree, without building a soup
+LINKED_DATA_XPATH = '//script[@type="application/ld+json"][1]/text()'
+
+# Top-level keys of `transformed` kept from the preloaded state
+PRELOAD_KEYS_TO_KEEP = (
+    'coreDataLayer', 'review', 'content4d',
+    'head.canonicalUrl', 'head.hreflang', 'head.description', 'head.title', 
+    'head.promo.dek', 'head.social.opinion','head.jsonld', 'head.contentID', 
+    'head.firstPublishDate', 'head.modifiedDate',  'head.hasSponsoredContent',)
+
+# Subkeys of `review` that are irrelevant to the scraper
+REVIEW_KEYS_TO_EXCLUDE = frozenset({
+    "recircs", "recircRelated", "recircMostPopular", "offers", "newsletterModules", 
+    "showBookmark", "showLocalisedOffers", "summaryProps", "tagCloud"})
+
+def extract_json_preload_data(soup:Optional[BeautifulSoup], html:Optional[bytes] = None) -> Optional[Dict[str,Any]]:
     """
-    Extracts and filters JSON preload data from a `BeautifulSoup` object.
+    Extracts and filters JSON preload data from the raw HTML or a `BeautifulSoup` object.
 
     Args:
         soup (Optional[BeautifulSoup]): 
             A `BeautifulSoup` object representing the parsed HTML of a page.
+        html (Optional[bytes], optional): 
+            The raw HTML of the same page. If given, the JSON is located with a single 
+            regex search over it, and `soup` is only searched if the regex misses 
+            (if `soup` is `None`, it is built from `html` then). Defaults to `None`.
 
     Returns:
         Optional[Dict[str, Any]]: 
@@ -32,14 +82,15 @@ def extract_json_preload_data(soup:Optional[BeautifulSoup]) -> Optional[Dict[str
             Returns `None` if extraction fails.
 
     Process:
-        - Finds a `<script>` tag containing `"window.__PRELOADED_STATE__"`.
+        - Matches `PRELOADED_STATE_REGEX` against `html`, if given.
+        - Otherwise, finds a `<script>` tag containing `"window.__PRELOADED_STATE__"`.
         - Extracts and loads the JSON content.
-        - Keeps only **relevant keys**.
-        - Removes **irrelevant subkeys** from the `"review"` section.
+        - Keeps only **relevant keys** (`PRELOAD_KEYS_TO_KEEP`).
+        - Removes **irrelevant subkeys** (`REVIEW_KEYS_TO_EXCLUDE`) from the `"review"` section.
 
     Example:
         ```python
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
         preload_data = extract_json_preload_data(soup)
         if preload_data:
             print(preload_data.keys())
@@ -55,32 +106,29 @@ def extract_json_preload_data(soup:Optional[BeautifulSoup]) -> Optional[Dict[str
         JSONDecodeError: If the extracted data is not valid JSON.
     """
 
+    match = None if html is None else PRELOADED_STATE_REGEX.search(html)
+
     try:
-        data = json.loads(soup
-            .find("script", string=lambda t: t and "window.__PRELOADED_STATE__" in t)
-            .string
-            .split("window.__PRELOADED_STATE__ =")
-            [-1]
-            .strip(" ;"))
-    except:
+        if match is not None:
+            data = json_loads(match.group(1))
+        else:
+            if soup is None:
+                soup = general.parse_html(html, parse_only=SCRIPT_STRAINER)
+            data = json_loads(soup
+                .find("script", string=PRELOADED_STATE_SCRIPT_REGEX)
+                .string
+                .partition("window.__PRELOADED_STATE__ =")
+                [2]
+                .strip(" ;"))
+    except Exception:
         return None
 
-    keys_to_keep = [
-    'coreDataLayer', 'review', 'content4d',
-    'head.canonicalUrl', 'head.hreflang', 'head.description', 'head.title', 
-    'head.promo.dek', 'head.social.opinion','head.jsonld', 'head.contentID', 
-    'head.firstPublishDate', 'head.modifiedDate',  'head.hasSponsoredContent',]
-
-    keys_to_exclude = ["recircs", "recircRelated", "recircMostPopular", "offers", "newsletterModules", "showBookmark", "showLocalisedOffers", "summaryProps", "tagCloud"]
-
-    data = {k:data['transformed'][k] for k in keys_to_keep} 
-    review_data = data['review']
-    review_data = {k:review_data[k] for k in review_data if k not in keys_to_exclude}
-    data['review'] = review_data
+    data = {k:data['transformed'][k] for k in PRELOAD_KEYS_TO_KEEP} 
+    data['review'] = {k:v for k,v in data['review'].items() if k not in REVIEW_KEYS_TO_EXCLUDE}
 
     return data
 
-def extract_json_linked_data_album(soup: Optional[BeautifulSoup]) -> Dict[str,Any]:
+def extract_json_linked_data_album(soup: Optional[BeautifulSoup], html:Optional[bytes] = None) -> Dict[str,Any]:
     """
     This function looks for a `<script>` tag of type `"application/ld+json"`
     and attempts to parse its JSON content.
@@ -88,6 +136,9 @@ def extract_json_linked_data_album(soup: Optional[BeautifulSoup]) -> Dict[str,An
     Args:
         soup (Optional[BeautifulSoup]): 
             A `BeautifulSoup` object representing the parsed HTML of a page.
+        html (Optional[bytes], optional): 
+            The raw HTML of the same page. If given, the tag is found with `LINKED_DATA_XPATH` 
+            on lxml's own tree and `soup` is not used (it may be `None`). Defaults to `None`.
 
     Returns:
         Optional[Dict[str, Any]]: 
@@ -100,7 +151,7 @@ def extract_json_linked_data_album(soup: Optional[BeautifulSoup]) -> Dict[str,An
 
     Example:
         ```python
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
         album_data = extract_json_linked_data_album(soup)
         if album_data:
             print(album_data["@type"])
@@ -115,15 +166,54 @@ def extract_json_linked_data_album(soup: Optional[BeautifulSoup]) -> Dict[str,An
         JSONDecodeError: If the extracted content is not valid JSON.
     """
 
+    if html is not None:
+        # Pitchfork serves UTF-8; a parser per call, since lxml parsers can't be shared between threads
+        texts = etree.HTML(html, parser=etree.HTMLParser(encoding='utf-8')).xpath(LINKED_DATA_XPATH)
+        return json_loads(str(texts[0])) if texts else {}
+
     data = {}
     tag = soup.find("script", type="application/ld+json")
     if tag:
-        data = json.loads(tag.string)
+        data = json_loads(str(tag.string))
     return data
 
+def __fast_iso(timestamp: str) -> str:
+    """
+    Normalizes an ISO 8601 timestamp to `datetime.isoformat()`.
+
+    Pitchfork's JSON-LD dates are canonical ISO 8601, which the C-implemented 
+    `datetime.fromisoformat` parses directly; `dateutil`'s much slower `isoparse` 
+    is only used for the strings it rejects. Both give the same result.
+    """
+    try:
+        # fromisoformat only accepts a 'Z' suffix from Python 3.11 on
+        return dt.datetime.fromisoformat(timestamp[:-1] + '+00:00' if timestamp.endswith('Z') else timestamp).isoformat()
+    except ValueError:
+        return parser.isoparse(timestamp).isoformat()
+
+def __lookup_ids(lookup:TSCDict, names:List[Any], row_type:type) -> Tuple[List[int], List[DatabaseRow]]:
+    """
+    Looks up the IDs of `names` in one of the `g.*_dict` lookups.
+
+    Returns:
+        Tuple[List[int], List[DatabaseRow]]: 
+            - The IDs, in the same order as `names`.
+            - A `row_type(id, name)` row for every name seen for the first time.
+
+    Notes:
+        - Names are interned, so the many reviews sharing a name share one string, 
+          and later lookups can match the stored key by identity.
+    """
+    names = [sys.intern(name) if name else name for name in names]
+    looked_up = [(name, *lookup[name]) for name in names]
+    ids = [name_id for _, _, name_id in looked_up]
+    new_rows = [row_type(name_id, name) for name, is_new, name_id in looked_up if is_new]
+    return ids, new_rows
+
 def scrape_review_data(
         json_pl:Dict[str,Any], 
-        json_ld:Dict[str,Any]) -> Tuple[List[Optional[Review]], List[Label], List[URL], List[Review_Labels]]:
+        json_ld:Dict[str,Any],
+        review_id:Optional[str] = None) -> Tuple[List[Optional[Review]], List[Label], List[URL], List[Review_Labels]]:
     """
     This function retrieves review metadata from two JSON structures:
     - **`json_pl` (preloaded JSON):** Contains page metadata and review details.
@@ -134,6 +224,9 @@ def scrape_review_data(
             The **preloaded JSON data** extracted from the page.
         json_ld (Dict[str, Any]): 
             The **structured JSON-LD data** extracted from the page.
+        review_id (Optional[str], optional): 
+            The review's `contentId`, if the caller already looked it up. 
+            Defaults to `None`, which reads it from `json_pl`.
 
     Returns:
         Tuple[List[Optional[Review]], List[Label], List[URL], List[Review_Labels]]: 
@@ -158,8 +251,9 @@ def scrape_review_data(
         ```
 
     Notes:
-        - **Thread safety**: Uses `g.lock` to prevent race conditions when modifying `g.labels_dict`.
-        - If the label field is missing, it defaults to `[None]`.
+        - **Thread safety**: `g.labels_dict` is a `TSCDict`, which assigns label IDs atomically.
+        - If the label field is missing, the review is linked to the null label (`label_id = 0`).
+        - Labels are stripped, so `" Indie Rock"` and `"Indie Rock"` share the same ID.
         - The `datePublished` and `dateModified` fields are parsed into ISO 8601 format.
         - The function **does not modify the database** directly; it returns processed data.
 
@@ -175,35 +269,28 @@ def scrape_review_data(
     if is_new_url:
         new_urls.append(URL(url_id, review_url))
 
+    content = general.dict_lookup(json_pl, ['coreDataLayer', 'content'])
     review = Review(
-        review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId']),
-        revisions = int(general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'noOfRevisions'])),
+        review_id = content['contentId'] if review_id is None else review_id,
+        revisions = int(content['noOfRevisions']),
         url_id = url_id,
         body = json_ld.get('reviewBody'),
         description = json_pl['head.description'],
-        date_mod = parser.isoparse(json_ld['dateModified']).isoformat(),
-        date_pub = parser.isoparse(json_ld['datePublished']).isoformat())
+        date_mod = __fast_iso(json_ld['dateModified']),
+        date_pub = __fast_iso(json_ld['datePublished']))
 
     labels = general.dict_lookup(json_pl, ['review', 'multiReviewHeaderProps', 'infoSliceFields', 'label'])
-    labels = labels.split(' / ') if labels else [None]
-
-    new_labels = []
-    review_labels = []
-    for label in labels:
-        with g.lock:  # 🔒 Ensure only one thread modifies `g.labels_dict`
-            if label not in g.labels_dict:
-                label_id = g.labels_id_counter
-                g.labels_dict[label] = label_id
-                g.labels_id_counter += 1
-                new_labels.append(Label(label_id, label))
-            else:
-                label_id = g.labels_dict[label]
-
-        review_labels.append(Review_Labels(review.review_id, label_id))
+    if not labels:
+        # Label 0 is the null label inserted by `db.__create_null_types`
+        return [review], [], new_urls, [Review_Labels(review.review_id, 0)]
+
+    labels = [label.strip() for label in labels.split(' / ')]
+    label_ids, new_labels = __lookup_ids(g.labels_dict, labels, Label)
+    review_labels = [Review_Labels(review.review_id, label_id) for label_id in label_ids]
 
     return [review], new_labels, new_urls, review_labels
 
-def scrape_authors_data(json_pl:Dict[str,Any]) -> Tuple[List[Author], List[Label], List[Review_Authors]]:
+def scrape_authors_data(json_pl:Dict[str,Any], review_id:Optional[str] = None) -> Tuple[List[Author], List[Label], List[Review_Authors]]:
     """
     This function retrieves **author IDs and contributor details** from `json_pl`, 
     assigns unique IDs, and creates relationships between authors and reviews.
@@ -211,6 +298,9 @@ def scrape_authors_data(json_pl:Dict[str,Any]) -> Tuple[List[Author], List[Label
     Args:
         json_pl (Dict[str, Any]): 
             The **preloaded JSON data** extracted from the page.
+        review_id (Optional[str], optional): 
+            The review's `contentId`, if the caller already looked it up. 
+            Defaults to `None`, which reads it from `json_pl`.
 
     Returns:
         Tuple[List[Author], List[URL], List[Review_Authors]]: 
@@ -234,14 +324,16 @@ def scrape_authors_data(json_pl:Dict[str,Any]) -> Tuple[List[Author], List[Label
 
     Notes:
         - If **no authors are found**, it assigns `author_id=0` and returns early.
-        - Uses **`g.lock`** to ensure **thread safety** when modifying `g.authors_set`.
+        - Uses **double-checked locking** on `g.authors_lock` for **thread safety**: authors 
+          already in `g.authors_set` are skipped without taking the lock.
         - The function **does not modify the database directly**; it returns structured data.
     """
     new_urls = []
     new_authors = []
     review_authors = []
 
-    review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
+    if review_id is None:
+        review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
     authorids = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'authorIds'])
     if authorids is None:
         review_authors.append(Review_Authors(review_id, 0))
@@ -250,19 +342,21 @@ def scrape_authors_data(json_pl:Dict[str,Any]) -> Tuple[List[Author], List[Label
     authors_info1 = authorids.split(',')
     authors_info2 = general.dict_lookup(json_pl, ['review', 'contributors', 'author', 'items'])
 
-    for i, author_id in enumerate(authors_info1):
+    for author_id, author_info in zip(authors_info1, authors_info2):
         
-        author_url = f'https://pitchfork.com{authors_info2[i]["url"]}'
+        author_url = f"{PITCHFORK_URL}{author_info['url']}"
         is_new_url, url_id = general.get_url_id(author_url, return_isnew=True)
         if is_new_url:
             new_urls.append(URL(url_id, author_url))
 
         review_authors.append(Review_Authors(review_id, author_id))
-        with g.lock:
+        if author_id in g.authors_set:
+            continue
+        with g.authors_lock:
             if author_id not in g.authors_set:
                 g.authors_set.add(author_id)
-                author_name = authors_info2[i]['name']
-                author_name = author_name if not author_name else (author_name.strip().replace('  ',' '))
+                author_name = author_info['name']
+                author_name = author_name if not author_name else sys.intern(author_name.strip().replace('  ',' '))
                 new_authors.append(Author(author_id, author_name, url_id))
 
     return new_authors, new_urls, review_authors
@@ -283,7 +377,7 @@ def __create_album_object(item:Dict[str,Any]) -> Album:
             A namedtuple representing the album.
 
     Process:
-        1. Extracts values safely using `.get()` or `general.dict_lookup()`.
+        1. Extracts values safely using `.get()`, reading `musicRating` only once.
         2. Converts **numeric fields** (`releaseYear`, `score`) where applicable.
         3. Defaults `is_best_new_music` and `is_best_new_reissue` to `0` if missing.
         4. Ensures `pitchfork_score` is **converted to an integer**.
@@ -305,27 +399,29 @@ def __create_album_object(item:Dict[str,Any]) -> Album:
         - **Handles missing values** gracefully (e.g., missing `score` returns `None`).
         - Converts `score` from **float (out of 10) to integer (out of 100)**.
         - Ensures `is_best_new_music` and `is_best_new_reissue` are **always integers**.
-        - Uses **`general.dict_lookup()`** to navigate nested structures.
+        - `score` is converted to `float` **before** scaling, so string scores such as `"8.2"` 
+          become `82` instead of being repeated ten times by `*`.
 
     Raises:
         ValueError: If numeric conversions fail.
     """
     publisher = item.get('publisher', None)
     year = item.get('releaseYear', None)
-    score = general.dict_lookup(item, ['musicRating','score'])
-    is_best_new_music = general.dict_lookup(item, ['musicRating','isBestNewMusic'])
-    is_best_new_reissue = general.dict_lookup(item, ['musicRating','isBestNewReissue'])
+    rating = item.get('musicRating') or {}
+    score = rating.get('score')
+    is_best_new_music = rating.get('isBestNewMusic')
+    is_best_new_reissue = rating.get('isBestNewReissue')
 
     return Album(
         album_id = item.get('albumId', None),
         album = item.get('dangerousHed', None),
-        publisher = publisher if publisher else None,
+        publisher = sys.intern(publisher) if publisher else None, # Few publishers, shared by many albums
         release_year = year if year else None,
-        pitchfork_score = None if (score is None) else int(float(score * 10)),
+        pitchfork_score = None if (score is None) else int(float(score) * 10),
         is_best_new_music = 0 if (is_best_new_music is None) else int(is_best_new_music),
         is_best_new_reissue = 0 if (is_best_new_reissue is None) else int(is_best_new_reissue),)
 
-def scrape_albums_data(json_pl:Dict[str,Any]) -> Tuple[List[Album], List[Review_Albums]]:
+def scrape_albums_data(json_pl:Dict[str,Any], review_id:Optional[str] = None) -> Tuple[List[Album], List[Review_Albums]]:
     """
     This function retrieves **album IDs and metadata** from `json_pl`, assigns unique IDs, 
     and creates relationships between albums and reviews.
@@ -333,6 +429,9 @@ def scrape_albums_data(json_pl:Dict[str,Any]) -> Tuple[List[Album], List[Review_
     Args:
         json_pl (Dict[str, Any]): 
             The **preloaded JSON data** extracted from the page.
+        review_id (Optional[str], optional): 
+            The review's `contentId`, if the caller already looked it up. 
+            Defaults to `None`, which reads it from `json_pl`.
 
     Returns:
         Tuple[List[Album], List[Review_Albums]]: 
@@ -353,10 +452,12 @@ def scrape_albums_data(json_pl:Dict[str,Any]) -> Tuple[List[Album], List[Review_
 
     Notes:
         - If **no albums are found**, the function returns empty lists.
-        - Uses **`g.lock`** to ensure **thread safety** when modifying `g.albums_set`.
+        - Uses **double-checked locking** on `g.albums_lock` for **thread safety**: albums 
+          already in `g.albums_set` are skipped without taking the lock.
         - The function delegates album object creation to `__create_album_object()`.
     """
-    review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
+    if review_id is None:
+        review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
     items_reviewed = general.dict_lookup(json_pl, ['review', 'multiReviewHeaderProps', 'itemsReviewed'])
     if not items_reviewed:
         return [], []
@@ -364,19 +465,20 @@ def scrape_albums_data(json_pl:Dict[str,Any]) -> Tuple[List[Album], List[Review_
     new_albums = []
     review_albums = []
 
+    # A single pass per item: its link row, and its album row if the album is new
     for item in items_reviewed:
         album_id = item['albumId']
-
         review_albums.append(Review_Albums(review_id, album_id))
-        
-        with g.lock:
-            if album_id not in g.albums_set:
 
+        if album_id in g.albums_set:
+            continue
+        with g.albums_lock:
+            if album_id not in g.albums_set:
                 g.albums_set.add(album_id)
                 new_albums.append(__create_album_object(item))
     return new_albums, review_albums
 
-def scrape_artists_data(json_pl:Dict[str,Any]
+def scrape_artists_data(json_pl:Dict[str,Any], review_id:Optional[str] = None
     ) -> Tuple[List[URL],List[Artist],List[Genre],List[Review_Artists],List[Review_Artist_Genres], ]:
     """
     This function retrieves **artist names, their profile URLs, and associated genres** 
@@ -385,6 +487,9 @@ def scrape_artists_data(json_pl:Dict[str,Any]
     Args:
         json_pl (Dict[str, Any]): 
             The **preloaded JSON data** extracted from the page.
+        review_id (Optional[str], optional): 
+            The review's `contentId`, if the caller already looked it up. 
+            Defaults to `None`, which reads it from `json_pl`.
 
     Returns:
         Tuple[
@@ -411,7 +516,7 @@ def scrape_artists_data(json_pl:Dict[str,Any]
 
     Notes:
         - If **no artists are found**, the function returns empty lists.
-        - Uses **`g.lock`** and **`g.lock`** to ensure **thread safety**.
+        - `g.artists_dict` and `g.genres_dict` are `TSCDict`s, which assign IDs atomically.
         - The function **does not modify the database directly**; it returns structured data.
 
     Raises:
@@ -423,7 +528,8 @@ def scrape_artists_data(json_pl:Dict[str,Any]
     review_artists = []
     review_artist_genres = []
 
-    review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
+    if review_id is None:
+        review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
     artists = general.dict_lookup(json_pl, ['review', 'headerProps', 'artists'])
 
     if artists is None:
@@ -431,16 +537,11 @@ def scrape_artists_data(json_pl:Dict[str,Any]
 
     for a in artists:
         artist_name = a['name']
+        artist_name = sys.intern(artist_name) if artist_name else artist_name
 
-        with g.lock:
-            if artist_name not in g.artists_dict:
-                artist_id = g.artists_id_counter
-                g.artists_dict[artist_name] = artist_id
-                g.artists_id_counter += 1
-            else:
-                artist_id = g.artists_dict[artist_name]
+        _, artist_id = g.artists_dict[artist_name]
 
-        artist_url = f'https://pitchfork.com/{a["uri"]}'
+        artist_url = f"{PITCHFORK_URL_SLASH}{a['uri']}"
         is_new_url, url_id = general.get_url_id(artist_url, return_isnew=True)
         if is_new_url:
             new_urls.append(URL(url_id, artist_url))
@@ -448,23 +549,13 @@ def scrape_artists_data(json_pl:Dict[str,Any]
         new_artists.append(Artist(artist_id, artist_name, url_id))
         review_artists.append(Review_Artists(review_id, artist_id))
 
-        for gen in a['genres']:
-            genre = gen['node']['name']
-
-            with g.lock:
-                if genre not in g.genres_dict:
-                    genre_id = g.genres_id_counter
-                    g.genres_dict[genre] = genre_id
-                    g.genres_id_counter += 1
-                    new_genres.append(Genre(genre_id, genre))
-                else:
-                    genre_id = g.genres_dict[genre]
-
-            review_artist_genres.append(Review_Artist_Genres(review_id, artist_id, genre_id))
+        genre_ids, artist_new_genres = __lookup_ids(g.genres_dict, [gen['node']['name'] for gen in a['genres']], Genre)
+        new_genres += artist_new_genres
+        review_artist_genres += [Review_Artist_Genres(review_id, artist_id, genre_id) for genre_id in genre_ids]
 
     return new_artists, new_genres, new_urls, review_artists, review_artist_genres
 
-def scrape_entities_data(json_pl:Dict[str,Any]) -> Tuple[List[Entity], List[Review_Entities]]:
+def scrape_entities_data(json_pl:Dict[str,Any], review_id:Optional[str] = None) -> Tuple[List[Entity], List[Review_Entities]]:
     """
     This function retrieves **named entities** (e.g., people, locations, topics) 
     from `json_pl`, assigns unique IDs, and creates relationships between reviews 
@@ -473,6 +564,9 @@ def scrape_entities_data(json_pl:Dict[str,Any]) -> Tuple[List[Entity], List[Revi
     Args:
         json_pl (Dict[str, Any]): 
             The **preloaded JSON data** extracted from the page.
+        review_id (Optional[str], optional): 
+            The review's `contentId`, if the caller already looked it up. 
+            Defaults to `None`, which reads it from `json_pl`.
 
     Returns:
         Tuple[
@@ -495,39 +589,25 @@ def scrape_entities_data(json_pl:Dict[str,Any]) -> Tuple[List[Entity], List[Revi
     Notes:
         - If **no entities are found**, the function returns an empty list for `new_entities`
           and a default `Review_Entities(review_id, entity_id=0, score=None)`.
-        - Uses **`g.lock`** to ensure **thread safety** when modifying `g.entities_dict`.
+        - `g.entities_dict` is a `TSCDict`, which assigns entity IDs atomically.
         - The function **does not modify the database directly**; it returns structured data.
 
     Raises:
         KeyError: If expected fields are missing from `json_pl`.
     """
-    review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
+    if review_id is None:
+        review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
     entities = general.dict_lookup(json_pl, ['content4d', 'entities'])
 
     if entities is None:
         return [], [Review_Entities(review_id, 0, None)]
 
-    new_entities = []
-    review_entities = []
-
-    for item in entities:
-        entity = item['name']
-        score = item['score']
-
-        with g.lock:
-            if entity not in g.entities_dict:
-                entity_id = g.entities_id_counter
-                g.entities_dict[entity] = entity_id
-                g.entities_id_counter += 1
-                new_entities.append(Entity(entity_id, entity))
-            else:
-                entity_id = g.entities_dict[entity]
-
-        review_entities.append(Review_Entities(review_id, entity_id, score))
+    entity_ids, new_entities = __lookup_ids(g.entities_dict, [item['name'] for item in entities], Entity)
+    review_entities = [Review_Entities(review_id, entity_id, item['score']) for entity_id, item in zip(entity_ids, entities)]
 
     return new_entities, review_entities
 
-def scrape_keywords_data(json_pl:Dict[str,Any]) -> Tuple[List[Keyword], List[Review_Keywords]]:
+def scrape_keywords_data(json_pl:Dict[str,Any], review_id:Optional[str] = None) -> Tuple[List[Keyword], List[Review_Keywords]]:
     """
     This function retrieves **keywords** (e.g., themes, topics, tags) 
     from `json_pl`, assigns unique IDs, and creates relationships between 
@@ -536,6 +616,9 @@ def scrape_keywords_data(json_pl:Dict[str,Any]) -> Tuple[List[Keyword], List[Rev
     Args:
         json_pl (Dict[str, Any]): 
             The **preloaded JSON data** extracted from the page.
+        review_id (Optional[str], optional): 
+            The review's `contentId`, if the caller already looked it up. 
+            Defaults to `None`, which reads it from `json_pl`.
 
     Returns:
         Tuple[
@@ -557,36 +640,23 @@ def scrape_keywords_data(json_pl:Dict[str,Any]) -> Tuple[List[Keyword], List[Rev
     Notes:
         - If **no keywords are found**, the function returns an empty list for `new_keywords`
           and a default `Review_Keywords(review_id, keyword_id=0, score=None)`.
-        - Uses **`g.lock`** to ensure **thread safety** when modifying `g.keywords_dict`.
+        - `g.keywords_dict` is a `TSCDict`, which assigns keyword IDs atomically.
         - The function **does not modify the database directly**; it returns structured data.
     """
-    review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
+    if review_id is None:
+        review_id = general.dict_lookup(json_pl, ['coreDataLayer', 'content', 'contentId'])
     keywords = general.dict_lookup(json_pl, ['content4d', 'keywords', 'list'])
 
     if keywords is None:
         return [], [Review_Keywords(review_id, 0, None)]
 
-    new_keywords = []
-    review_keywords = []
-    for item in keywords:
-        keyword = item['keyword']
-        score = item['score']
-
-        with g.lock:
-            if keyword not in g.keywords_dict:
-                keyword_id = g.keywords_id_counter
-                g.keywords_dict[keyword] = keyword_id
-                g.keywords_id_counter += 1
-                new_keywords.append(Keyword(keyword_id, keyword))
-            else:
-                keyword_id = g.keywords_dict[keyword]
-
-        review_keywords.append(Review_Keywords(review_id, keyword_id, score))
+    keyword_ids, new_keywords = __lookup_ids(g.keywords_dict, [item['keyword'] for item in keywords], Keyword)
+    review_keywords = [Review_Keywords(review_id, keyword_id, item['score']) for keyword_id, item in zip(keyword_ids, keywords)]
 
     return new_keywords, review_keywords
 
 ## Orchestrate the scraping of an album review
-def scrape_json_data(get_connection:SQLite3ConnectionGenerator, url_id:int, url:str, timeout:float=0.5) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def scrape_json_data(get_connection:SQLite3ConnectionGenerator, url_id:int, url:str, timeout:float=0.5, verbose:bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     This function retrieves and parses two types of JSON metadata:
     - **Preloaded state JSON** (`window.__PRELOADED_STATE__`): Contains rich metadata about the page.
@@ -601,6 +671,9 @@ def scrape_json_data(get_connection:SQLite3ConnectionGenerator, url_id:int, url:
             The webpage URL to scrape.
         timeout (float, optional): 
             The timeout in seconds before retrying a failed request. Defaults to `0.5`.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
 
     Returns:
         Tuple[
@@ -608,7 +681,7 @@ def scrape_json_data(get_connection:SQLite3ConnectionGenerator, url_id:int, url:
             Optional[Dict[str, Any]]   # Extracted linked data JSON-LD (or `None` on failure)]
 
     Process:
-        1. **Fetches the webpage using `general.parse_url()`**.
+        1. **Fetches the webpage using `general.fetch_url()`**.
         2. **Parses the preloaded state JSON** using `extract_json_preload_data()`.
         3. **Parses the linked data JSON-LD** using `extract_json_linked_data_album()`.
         4. **Logs failures** if extraction fails at any stage.
@@ -622,34 +695,173 @@ def scrape_json_data(get_connection:SQLite3ConnectionGenerator, url_id:int, url:
 
     Notes:
         - If **no connection can be established**, both return values will be `None`.
-        - Uses **`traceback.format_exc()`** to capture and log exceptions.
+        - Logs the full **`traceback.format_exc()`** of failures only if `verbose`.
         - The function **does not modify the database**; it logs failures but only returns data.
 
     Raises:
         Exception: Any unexpected error is logged, and `None` is returned.
     """
-    soup = general.parse_url(get_connection, url=url, format='html.parser', timeout=timeout)
+    page = general.fetch_url(get_connection, url=url, timeout=timeout)
 
-    if soup is None:
-        message = traceback.format_exc()
-        db.log_event(get_connection, url_id=url_id, process="Couldn't stablish connection", success=0, message=message)
+    if page is None:
+        db.log_event(get_connection, url_id=url_id, process="Couldn't stablish connection", success=0, message=url)
         return None, None
-    
+
+    return extract_json_data(get_connection, url_id, None, html=page.content, verbose=verbose)
+
+def extract_json_data(get_connection:SQLite3ConnectionGenerator, url_id:int, soup:Optional[BeautifulSoup], html:Optional[bytes] = None, verbose:bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Parses the preloaded state JSON and the linked data JSON-LD out of an already 
+    fetched review page. This is the parsing half of `scrape_json_data()`.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection.
+        url_id (int): 
+            A unique identifier for the URL.
+        soup (Optional[BeautifulSoup]): 
+            The parsed HTML of the review page. May be `None` if `html` is given.
+        html (Optional[bytes], optional): 
+            The raw HTML of the review page, used for the fast paths of 
+            `extract_json_preload_data()` and `extract_json_linked_data_album()`. Defaults to `None`.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
+
+    Returns:
+        Tuple[
+            Optional[Dict[str, Any]],  # Extracted preloaded JSON data (or `None` on failure)
+            Optional[Dict[str, Any]]   # Extracted linked data JSON-LD (or `None` on failure)]
+
+    Notes:
+        - Failures are logged with `db.log_event()` and `(None, None)` is returned.
+    """
+    json_preload, json_linked_data, failure = __extract_json(soup, html, verbose)
+
+    if failure is not None:
+        process, message = failure
+        db.log_event(get_connection, url_id=url_id, process=process, success=0, message=message)
+
+    return json_preload, json_linked_data
+
+def __extract_json(soup:Optional[BeautifulSoup], html:Optional[bytes] = None, verbose:bool = False) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Tuple[str, str]]]:
+    """
+    Parses both JSON blobs of a review page without touching the database, so it can run in another process.
+
+    Returns:
+        Tuple[
+            Optional[Dict[str, Any]],  # Extracted preloaded JSON data (or `None` on failure)
+            Optional[Dict[str, Any]],  # Extracted linked data JSON-LD (or `None` on failure)
+            Optional[Tuple[str, str]]  # `(process, message)` to be logged, or `None` if nothing failed]
+
+    Notes:
+        - Pages whose raw HTML lacks `PRELOADED_STATE_MARKER` (404s, non-review pages) are 
+          skipped before any parsing.
+    """
+    if (html is not None) and (PRELOADED_STATE_MARKER not in html):
+        return None, None, ('Skipped page without preloaded state', 'window.__PRELOADED_STATE__ not found')
+
     try:
-        json_preload = extract_json_preload_data(soup)
-    except:
-        message = traceback.format_exc()
-        db.log_event(get_connection, url_id=url_id, process='Failed at parsing json preload data', success=0, message=message)
-        return None, None
+        json_preload = extract_json_preload_data(soup, html)
+    except Exception as e:
+        return None, None, ('Failed at parsing json preload data', general.error_message(e, verbose))
 
     try:
-        json_linked_data = extract_json_linked_data_album(soup)
-    except:
-        message = traceback.format_exc()
-        db.log_event(get_connection, url_id=url_id, process='Failed at parsing json linked data', success=0, message=message)
-        return None, None
-    
-    return json_preload, json_linked_data
+        json_linked_data = extract_json_linked_data_album(soup, html)
+    except Exception as e:
+        return None, None, ('Failed at parsing json linked data', general.error_message(e, verbose))
+
+    return json_preload, json_linked_data, None
+
+def parse_review_page(html:bytes, verbose:bool = False) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Tuple[str, str]]]:
+    """
+    Parses the JSON metadata of a review page from its raw HTML. 
+    This is the CPU-bound part of scraping a review, and what the parse pool runs.
+
+    Args:
+        html (bytes): 
+            The raw HTML of the review page.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
+
+    Returns:
+        Tuple[
+            Optional[Dict[str, Any]],  # Extracted preloaded JSON data (or `None` on failure)
+            Optional[Dict[str, Any]],  # Extracted linked data JSON-LD (or `None` on failure)
+            Optional[Tuple[str, str]]  # `(process, message)` to be logged, or `None` if nothing failed]
+
+    Notes:
+        - It neither logs nor assigns IDs: the database connection and the `g.*` lookups 
+          live in the parent process, which handles both once the result is back.
+    """
+    return __extract_json(None, html, verbose)
+
+## Parse Pool
+# BeautifulSoup and the JSON decoding hold the GIL, so with threads alone parsing doesn't scale past one core.
+# While the pool is running, `scrape_album_review()` threads keep downloading pages and hand the parsing to it.
+parse_pool: Optional[ProcessPoolExecutor] = None
+parse_pool_workers: Optional[int] = None # `max_workers` of the running pool, to start an identical one if it breaks
+parse_pool_lock = threading.Lock()
+
+def start_parse_pool(max_workers:Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Starts the pool of processes that `scrape_album_review()` uses to parse review pages.
+
+    Args:
+        max_workers (Optional[int], optional): 
+            The number of processes. Defaults to `None` (one per CPU).
+
+    Returns:
+        ProcessPoolExecutor: 
+            The running pool. Calling the function again returns the same pool.
+
+    Notes:
+        - Workers are **spawned**, not forked: the scraper runs logging and database writer 
+          threads, and forking a process with running threads may copy locks in a held state.
+        - Scripts starting the pool must be guarded by `if __name__ == '__main__':`.
+    """
+    global parse_pool, parse_pool_workers
+    with parse_pool_lock:
+        if parse_pool is None:
+            parse_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+            parse_pool_workers = max_workers
+        return parse_pool
+
+def stop_parse_pool() -> None:
+    """
+    Stops the parse pool, if there is one. `scrape_album_review()` then parses pages in the calling thread.
+    """
+    global parse_pool
+    with parse_pool_lock:
+        pool, parse_pool = parse_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+atexit.register(stop_parse_pool)
+
+def __restart_parse_pool(broken: ProcessPoolExecutor) -> None:
+    """
+    Replaces `broken`, a pool that lost a worker (e.g. killed by the OOM killer or crashed in lxml) 
+    and now fails every submission, with a new one. Only the first thread to notice restarts it.
+    """
+    global parse_pool
+    with parse_pool_lock:
+        if parse_pool is not broken:
+            return
+        parse_pool = ProcessPoolExecutor(max_workers=parse_pool_workers, mp_context=multiprocessing.get_context('spawn'))
+    broken.shutdown(wait=False)
+
+def __parse_review_page_in_pool(pool: ProcessPoolExecutor, html: bytes, verbose: bool = False) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Tuple[str, str]]]:
+    """
+    Runs `parse_review_page()` in `pool`. If the pool is broken, it is restarted and 
+    the page is parsed in the calling thread instead, so it isn't lost.
+    """
+    try:
+        return pool.submit(parse_review_page, html, verbose).result()
+    except BrokenProcessPool:
+        __restart_parse_pool(pool)
+        return parse_review_page(html, verbose)
 
 def scrape_section(
     get_connection: SQLite3ConnectionGenerator, 
@@ -657,15 +869,15 @@ def scrape_section(
     section: str, 
     func: Callable[..., Tuple[Any, ...]], 
     *inputs: Tuple[Dict[str, Any]],
-    verbose:bool = False
-    ) -> None:
+    verbose: bool = False,
+    ) -> List[DatabaseRow]:
     """
-    Executes a scraping function for a specific section and inserts the extracted data into the database.
+    Executes a scraping function for a specific section and collects the extracted rows.
 
     This function:
     - Calls a section-specific scraping function (e.g., `scrape_authors_data`, `scrape_entities_data`).
     - Handles any errors that occur during the scraping process.
-    - Inserts the extracted data into the database.
+    - Flattens the extracted data into a single list of rows, ready to be inserted.
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
@@ -678,44 +890,128 @@ def scrape_section(
             The function responsible for scraping the section.
         *inputs (Tuple[Dict[str, Any]]): 
             The JSON input(s) to pass to the section scraping function.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
 
     Returns:
-        None: This function does not return a value but logs failures if they occur.
+        List[DatabaseRow]: 
+            All the rows extracted for the section, or an empty list if scraping fails.
 
     Process:
         1. **Calls the scraping function (`func`)** with the provided inputs.
         2. **Catches and logs errors** if scraping fails.
-        3. **Iterates through the returned data** and inserts each set of records into the database.
-        4. **Handles errors that occur during database insertion**.
+        3. **Concatenates the returned lists** of records into a single list.
 
     Example:
         ```python
-        scrape_section(get_connection, url_id=101, section="authors", func=scrape_authors_data, json_pl)
+        rows = scrape_section(get_connection, 101, "authors", scrape_authors_data, json_pl)
         ```
 
     Notes:
-        - If the scraping function **fails**, an error message is logged, and the function exits.
-        - If the database insertion **fails**, an error message is logged, but the function continues processing other data.
-        - The function **does not modify the database directly**; it calls `db.insert_named_tuples()`.
+        - If the scraping function **fails**, an error message is logged, and an empty list is returned.
+        - The function **does not insert anything**; `extract_album_review_rows()` collects the rows 
+          of every section so they are inserted at once.
 
     Raises:
         Exception: Any unexpected error is logged, and the function exits early.
     """
     try:
         list_of_lists = func(*inputs)
-    except:
-        message = traceback.format_exc()
+    except Exception as e:
+        message = general.error_message(e, verbose)
         db.log_event(get_connection, url_id=url_id, process=f'Failed at parsing {section} data', success=0, message=message)
-        return
+        return []
+
+    return [row for list_of_tuples in list_of_lists for row in list_of_tuples]
+
+def extract_album_review_rows(get_connection:SQLite3ConnectionGenerator, url_id:int, soup:Optional[BeautifulSoup], html:Optional[bytes] = None, verbose:bool = False) -> List[DatabaseRow]:
+    """
+    Extracts every database row of an already fetched album review page, without inserting them.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection.
+        url_id (int): 
+            A unique identifier for the URL.
+        soup (Optional[BeautifulSoup]): 
+            The parsed HTML of the review page. May be `None` if `html` is given.
+        html (Optional[bytes], optional): 
+            The raw HTML of the review page, passed on to `extract_json_data()`. Defaults to `None`.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
 
-    for list_of_tuples in list_of_lists:
-        try:
-            db.insert_named_tuples(get_connection, list_of_tuples, verbose=verbose)
-        except:
-            message = traceback.format_exc()
-            db.log_event(get_connection, url_id=url_id, process=f'Failed at inserting {section} data', success=0, message=message)
+    Returns:
+        List[DatabaseRow]: 
+            The rows of all sections (**review, albums, authors, artists, entities, keywords**). 
+            Empty if the JSON metadata couldn't be parsed.
+
+    Process:
+        1. **Parses the JSON metadata** using `extract_json_data()`; if that fails, returns an empty list.
+        2. **Builds the rows of every section** listed in `REVIEW_SECTIONS` with `build_album_review_rows()`.
+        3. **Calls `scrape_section()`** for each section, passing the appropriate JSON data.
 
-def scrape_album_review(get_connection:SQLite3ConnectionGenerator, url_id:int, url:str, timeout:float=0.5, verbose:bool = False) -> None:
+    Notes:
+        - Parsing failures are logged by `extract_json_data()` and `scrape_section()`.
+        - Callers can add rows of their own (e.g. the review's `URL`) and insert everything in one go.
+    """
+    json_preload, json_linked_data = extract_json_data(get_connection, url_id, soup, html, verbose)
+    return build_album_review_rows(get_connection, url_id, json_preload, json_linked_data, verbose)
+
+# The sections of a review: (name, scraping function, whether it also takes the JSON-LD)
+REVIEW_SECTIONS = (
+    ('review', scrape_review_data, True),
+    ('albums', scrape_albums_data, False),
+    ('authors', scrape_authors_data, False),
+    ('artists', scrape_artists_data, False),
+    ('entities', scrape_entities_data, False),
+    ('keywords', scrape_keywords_data, False),
+    )
+
+def build_album_review_rows(
+    get_connection:SQLite3ConnectionGenerator, 
+    url_id:int, 
+    json_preload:Optional[Dict[str, Any]], 
+    json_linked_data:Optional[Dict[str, Any]],
+    verbose:bool = False,
+    ) -> List[DatabaseRow]:
+    """
+    Builds every database row of a review from its already parsed JSON metadata, without inserting them.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection.
+        url_id (int): 
+            A unique identifier for the URL.
+        json_preload (Optional[Dict[str, Any]]): 
+            The preloaded state JSON, as returned by `extract_json_data()` or `parse_review_page()`.
+        json_linked_data (Optional[Dict[str, Any]]): 
+            The linked data JSON-LD, as returned by `extract_json_data()` or `parse_review_page()`.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
+
+    Returns:
+        List[DatabaseRow]: 
+            The rows of all sections, or an empty list if either JSON is missing.
+
+    Notes:
+        - IDs are assigned here, through the `g.*` lookups, so it must run in the main process.
+    """
+    if (json_preload is None) or (json_linked_data is None):
+        return []
+
+    # Looked up once here instead of once per section
+    review_id = general.dict_lookup(json_preload, ['coreDataLayer', 'content', 'contentId'])
+
+    rows = []
+    for section, func, needs_linked_data in REVIEW_SECTIONS:
+        inputs = (json_preload, json_linked_data, review_id) if needs_linked_data else (json_preload, review_id)
+        rows += scrape_section(get_connection, url_id, section, func, *inputs, verbose=verbose)
+    return rows
+
+def scrape_album_review(get_connection:SQLite3ConnectionGenerator, url_id:int, url:str, timeout:float=0.5, verbose:bool = False) -> bool:
     """
     This function extracts JSON metadata from the provided `url`, then 
     processes various sections of the review, including **albums, authors, 
@@ -730,15 +1026,22 @@ def scrape_album_review(get_connection:SQLite3ConnectionGenerator, url_id:int, u
             The webpage URL of the album review.
         timeout (float, optional): 
             The timeout in seconds before retrying a failed request. Defaults to `0.5`.
+        verbose (bool, optional): 
+            If `True`, prints the inserts and logs failures with their full traceback. Defaults to `False`.
 
     Returns:
-        None: This function does not return a value but logs failures if they occur.
+        bool: 
+            `False` if the page couldn't be fetched (so the caller may retry it later), 
+            `True` otherwise. Parsing failures are logged but still return `True`, 
+            since fetching the page again wouldn't change the result.
 
     Process:
-        1. **Fetches and parses JSON metadata** from the review page using `scrape_json_data()`.
-        2. **Checks if JSON extraction was successful**; if not, exits early.
-        3. **Defines a mapping of section names to functions** responsible for extracting each section.
-        4. **Calls `scrape_section()`** for each section, passing the appropriate JSON data.
+        1. **Fetches the review page** with `general.fetch_url()`; if that fails, returns `False`.
+        2. **Extracts the rows of every section** with `extract_album_review_rows()`, or, while the 
+           parse pool is running (`start_parse_pool()`), parses the page in a worker process with 
+           `parse_review_page()` and builds the rows with `build_album_review_rows()`. If a worker 
+           crashed and broke the pool, the pool is restarted and the page is parsed in the calling thread.
+        3. **Inserts the rows of all sections at once**, so they are committed in a single transaction.
 
     Example:
         ```python
@@ -746,26 +1049,31 @@ def scrape_album_review(get_connection:SQLite3ConnectionGenerator, url_id:int, u
         ```
 
     Notes:
-        - If **JSON extraction fails**, the function exits early without processing sections.
-        - Uses **a dictionary (`sections`)** to dynamically route processing to the correct function.
-        - Calls `scrape_section()` to handle each section separately.
+        - If **JSON extraction fails**, nothing is inserted.
 
     Raises:
         Exception: Any unexpected error is logged, and the function exits early.
     """
-    json_preload, json_linked_data = scrape_json_data(get_connection, url_id, url, timeout=timeout)
+    page = general.fetch_url(get_connection, url=url, timeout=timeout)
+
+    if page is None:
+        db.log_event(get_connection, url_id=url_id, process="Couldn't stablish connection", success=0, message=url)
+        return False
+
+    pool = parse_pool
+    if pool is None:
+        rows = extract_album_review_rows(get_connection, url_id, None, html=page.content, verbose=verbose)
+    else:
+        json_preload, json_linked_data, failure = __parse_review_page_in_pool(pool, page.content, verbose)
+        if failure is not None:
+            process, message = failure
+            db.log_event(get_connection, url_id=url_id, process=process, success=0, message=message)
+        rows = build_album_review_rows(get_connection, url_id, json_preload, json_linked_data, verbose)
 
-    if (json_preload is None) or (json_linked_data is None):
-        return
-
-    sections = {
-        'review' : scrape_review_data,
-        'albums' : scrape_albums_data,
-        'authors' : scrape_authors_data,
-        'artists' : scrape_artists_data,
-        'entities' : scrape_entities_data,
-        'keywords' : scrape_keywords_data,}
-
-    for section, func in sections.items():
-        inputs = (json_preload,) if section != 'review' else (json_preload, json_linked_data)
-        scrape_section(get_connection, url_id, section, func, *inputs, verbose=verbose)
+    try:
+        db.insert_named_tuples(get_connection, rows, verbose=verbose)
+    except Exception as e:
+        message = general.error_message(e, verbose)
+        db.log_event(get_connection, url_id=url_id, process='Failed at inserting album review data', success=0, message=message)
+
+    return True
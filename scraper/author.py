@@ -1,75 +1,96 @@
 import re
-import pytz
-import json
+import sys
 import datetime as dt
-import traceback
+import functools
 
 from . import db
+from . import album
 from . import general
 from . import globals as g
 from .types import *
-from typing import Optional, Any, Dict, List
-
-def scrape_json_data(
+from .types import VIENNA_TZ
+from typing import Optional, Any, Dict, List, Tuple
+
+# Cleaning author types, in a single pass over the (title-cased) string:
+# - "Pitchfork", with the ", " before it if any, is removed (some author types have it, 
+#   and "Pitchfork" alone is declared as an author type here and there, should be "None")
+# - Runs of spaces are collapsed into a single one
+AUTHOR_TYPE_CLEANUP_REGEX = re.compile(r'(?P<pitchfork>(?:, +)?Pitchfork)| +')
+
+# Paths of the author page JSON, built once instead of on every call
+AUTHOR_NAME_PATH = ('transformed', 'coreDataLayer', 'content', 'authorNames')
+AUTHOR_TYPE_PATHS = (
+    ('transformed', 'contributor', 'header', 'title'),  # This is what is actually shown to users
+    ('transformed', 'content4d', 'title'),              # Sometimes this was used (especially for older authors)
+    )
+
+# Titles found where the author type should be, which aren't author types
+ANOMALOUS_AUTHOR_TYPES = frozenset({
+    'Ars Technica', 
+    'Dice For Any Occasion', 
+    '“Made For Love” By Alissa Nutting', 
+    'Review: Motorola Droid Razr Maxx',
+    'Megan Buerger | Staff |' })
+
+# Errors expected from a malformed author page: bad JSON (`JSONDecodeError` is a `ValueError`), 
+# missing `<script>` tags or fields (`AttributeError`, `KeyError`) and fields of the wrong type (`TypeError`).
+# Anything else is a bug and is left to propagate
+AUTHOR_PAGE_ERRORS = (ValueError, AttributeError, KeyError, TypeError)
+
+# Distinct raw author types (and names) whose cleaned form is memoized
+AUTHOR_TYPE_CACHE_SIZE = 2048
+
+def extract_json_data(
     get_connection: SQLite3ConnectionGenerator, 
     url_id: int, 
-    url: str, 
-    timeout: float = 0.5
+    html: bytes, 
+    verbose: bool = False
     ) -> Optional[Dict[str, Any]]:
     """
-    This function fetches an author's **biography page**, extracts the 
-    **preloaded JSON metadata**, and parses it into a dictionary.
+    Parses the **preloaded JSON metadata** of an already fetched author page 
+    (see `scrape_authors_page()`).
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
-            A function that returns an SQLite connection.
+            A function that returns an SQLite connection (failures are logged).
         url_id (int): 
             A unique identifier for the URL.
-        url (str): 
-            The author's biography page URL.
-        timeout (float, optional): 
-            The timeout in seconds before retrying a failed request. Defaults to `0.5`.
+        html (bytes): 
+            The raw HTML of the author page.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
 
     Returns:
         Optional[Dict[str, Any]]: 
             The extracted **preloaded JSON metadata** if successful, otherwise `None`.
 
     Process:
-        1. **Fetches the webpage using `general.parse_url()`**.
-        2. **Locates the `<script>` tag** containing `"window.__PRELOADED_STATE__"`.
-        3. **Extracts and parses the JSON data** from the script tag.
-        4. **Logs failures** if JSON parsing fails.
-
-    Example:
-        ```python
-        json_pl = scrape_json_data(get_connection, url_id=201, url="https://pitchfork.com/staff/author-name")
-        print(json_pl.keys())  # Example output: ['transformed', 'head', 'coreDataLayer']
-        ```
+        1. **Locates the JSON** with `album.PRELOADED_STATE_REGEX` over the raw HTML; only if it misses, 
+           builds a soup of the `<script>` tags and searches the one containing `"window.__PRELOADED_STATE__"`.
+        2. **Parses the JSON data** with `album.json_loads` (`orjson` if installed), straight from the matched bytes.
+        3. **Logs failures** if JSON parsing fails.
 
     Notes:
-        - If **no connection can be established**, `None` is returned.
-        - Uses **`traceback.format_exc()`** to capture and log exceptions.
-        - The function **does not modify the database**; it logs failures but only returns data.
-
-    Raises:
-        JSONDecodeError: If JSON parsing fails.
+        - Only **`AUTHOR_PAGE_ERRORS`** are caught and logged, with the full 
+          **`traceback.format_exc()`** only if `verbose`.
     """
-    soup = general.parse_url(get_connection, url=url, format='html.parser', timeout=timeout)
-
-    if soup is None:
-        return None
-
-    # Extract json preload data from page
+    # Extract json preload data from page, without building a soup unless the regex misses
     try:
-        json_preload = json.loads(soup
-            .find("script", string=lambda t: t and "window.__PRELOADED_STATE__" in t)
+        match = album.PRELOADED_STATE_REGEX.search(html)
+        if match is not None:
+            return album.json_loads(match.group(1))
+
+        soup = general.parse_html(html, parse_only=album.SCRIPT_STRAINER)
+        json_preload = album.json_loads(soup
+            .find("script", string=album.PRELOADED_STATE_SCRIPT_REGEX)
             .string
-            .split("window.__PRELOADED_STATE__ =")
-            [-1]
+            .partition("window.__PRELOADED_STATE__ =")
+            [2]
             .strip(" ;"))
         return json_preload
-    except:
-        message = traceback.format_exc()
+    except AUTHOR_PAGE_ERRORS as e:
+        message = general.error_message(e, verbose)
         db.log_event(get_connection, url_id=url_id, process='Failed at parsing json preload data', success=0, message=message)
         return None
     
@@ -109,26 +130,55 @@ def scrape_authors_bio(json_pl: Dict[str, Any], author_id: str) -> Author_Bio:
     Raises:
         KeyError: If expected fields are missing from `json_pl`.
     """
-    path_1 = ['transformed', 'head.description']
-    path_2 = ['transformed', 'head.social.description']
-
-    for path in [path_1, path_2,]:
-        raw_bio = general.dict_lookup(json_pl, path)
-        if raw_bio is not None:
-            break
-
-    if raw_bio is not None:
-        if raw_bio == '':
-            bio = None
-        else:
-            legend_when_empy = "bio and get latest news stories and articles."
-            bio = None if (legend_when_empy in raw_bio.lower()) else raw_bio
-
-    noofrevs = general.dict_lookup(json_pl, ['transformed', 'coreDataLayer', 'content', 'noOfRevisions'])
-    date_pub = general.dict_lookup(json_pl, ['transformed', 'payment', 'negotiation', 'content', 'publishDate'])
+    # Every field lives under `transformed`, so it is looked up once
+    transformed = json_pl.get('transformed') or {}
+
+    raw_bio = transformed.get('head.description')
+    if raw_bio is None:
+        raw_bio = transformed.get('head.social.description')
+
+    bio = None
+    if raw_bio:
+        legend_when_empy = "bio and get latest news stories and articles."
+        bio = None if (legend_when_empy in raw_bio.lower()) else raw_bio
+
+    noofrevs = general.dict_lookup(transformed, ['coreDataLayer', 'content', 'noOfRevisions'])
+    date_pub = general.dict_lookup(transformed, ['payment', 'negotiation', 'content', 'publishDate'])
     
     return Author_Bio(author_id, date_pub, noofrevs, bio)
 
+def __clean_author_type_match(match: re.Match) -> str:
+    """Replacement for `AUTHOR_TYPE_CLEANUP_REGEX`: drops "Pitchfork", collapses spaces."""
+    return '' if match.group('pitchfork') else ' '
+
+@functools.lru_cache(maxsize=AUTHOR_TYPE_CACHE_SIZE)
+def __reformat_author_type(t: Optional[str]) -> Optional[str]:
+    """
+    Cleans and standardizes an extracted author type (or author name).
+
+    - Strips leading/trailing spaces.
+    - Capitalizes each word.
+    - Removes "Pitchfork" if mistakenly present.
+
+    The same few titles ("Contributor", "Senior Editor", ...) show up on thousands 
+    of author pages, so the result is memoized by the raw string.
+
+    Args:
+        t (Optional[str]): Raw author type string.
+
+    Returns:
+        Optional[str]: Cleaned and standardized author type or `None` if invalid.
+    """
+    if t is None:
+        return None
+    
+    t = (AUTHOR_TYPE_CLEANUP_REGEX
+        .sub(__clean_author_type_match, t.title())  # Capitalize first letter of each word, then clean in one pass
+        .strip()                                    # Remove all leading and trailing spaces
+        .replace('  ',' '))                         # Spaces left on both sides of a removed "Pitchfork"
+    
+    return t if t else None
+
 def scrape_authors_type(json_pl:Dict[str,Any]) -> List[Author_Type]:
     """
     This function retrieves the **author's displayed title** (e.g., "Senior Editor") and 
@@ -160,38 +210,9 @@ def scrape_authors_type(json_pl:Dict[str,Any]) -> List[Author_Type]:
         - If **no valid title is found**, an **empty list is returned**.
         - Uses **two JSON paths** (`["transformed", "contributor", "header", "title"]`, 
           `["transformed", "content4d", "title"]`) to maximize retrieval success.
-        - Uses **`g.lock`** to ensure **thread safety**.
+        - **Thread safety**: `g.author_types_dict` is a `TSCDict`, which assigns author type IDs atomically.
         - **Filters out anomalous types** (e.g., long strings, irrelevant data).
     """
-    def reformat_author_type(t: Optional[str]) -> Optional[str]:
-        """
-        Cleans and standardizes the extracted author type.
-
-        - Strips leading/trailing spaces.
-        - Capitalizes each word.
-        - Removes "Pitchfork" if mistakenly present.
-        - Ensures reasonable length and removes anomalies.
-
-        Args:
-            t (Optional[str]): Raw author type string.
-
-        Returns:
-            Optional[str]: Cleaned and standardized author type or `None` if invalid.
-        """
-        if t is None:
-            return None
-        
-        t = (re
-            .sub(r' +', ' ', t) # regular expression to replace one or more spaces with a single space
-            .strip()            # Remove all leading and trailing spaces
-            .title()            # Capitalize first letter of each word
-            .replace(', Pitchfork', '')     # Some author types have it, shouldn't be there
-            .replace('Pitchfork', '')       # Pichfork declared as an author type here and there, should be "None"
-            .strip()
-            .replace('  ',' '))
-        
-        return t if t else None
-
     def get_author_name(json_pl: Dict[str, Any]) -> Optional[str]:
         """
         Extracts and cleans the author's name from JSON.
@@ -202,25 +223,26 @@ def scrape_authors_type(json_pl:Dict[str,Any]) -> List[Author_Type]:
         Returns:
             Optional[str]: The author's lowercase name or `None` if not found.
         """
-        author_name = general.dict_lookup(json_pl, ['transformed', 'coreDataLayer', 'content', 'authorNames'])
-        author_name = reformat_author_type(author_name)
+        author_name = general.dict_lookup(json_pl, AUTHOR_NAME_PATH)
+        author_name = __reformat_author_type(author_name)
         if author_name:
             return author_name.lower()
         return None
 
-    def get_author_type(json_pl: Dict[str, Any], path: List[str]) -> Optional[str]:
+    def get_author_type(json_pl: Dict[str, Any], path: Tuple[str, ...], author_name: Optional[str]) -> Optional[str]:
         """
         Extracts, cleans, and validates an author's type/title.
 
         Args:
             json_pl (Dict[str, Any]): The preloaded JSON metadata.
-            path (List[str]): The JSON path to the author type.
+            path (Tuple[str, ...]): The JSON path to the author type.
+            author_name (Optional[str]): The author's name, as returned by `get_author_name()`.
 
         Returns:
             Optional[str]: A cleaned and validated author type or `None` if invalid.
         """
         at = general.dict_lookup(json_pl, path)
-        at = reformat_author_type(at)
+        at = __reformat_author_type(at)
 
         if at is None:
             return None
@@ -228,41 +250,25 @@ def scrape_authors_type(json_pl:Dict[str,Any]) -> List[Author_Type]:
         if len(at) > 35:
             return None
         
-        anomalous_types = [
-            None,
-            'Ars Technica', 
-            'Dice For Any Occasion', 
-            '“Made For Love” By Alissa Nutting', 
-            'Review: Motorola Droid Razr Maxx',
-            'Megan Buerger | Staff |' ]
-        
-        if at in anomalous_types:
+        if at in ANOMALOUS_AUTHOR_TYPES:
             return None
 
-        author_name = get_author_name(json_pl)
         if author_name:
             if (author_name in at.lower()) or (at.lower() in author_name):
                 return None
 
         return at
     
-    path_1 = ['transformed', 'contributor', 'header', 'title']      # This is what is actually shown to users
-    path_2 = ['transformed', 'content4d', 'title']                  # Sometimes this was used (especially for older authors)
-    paths = [path_1, path_2]
-    
-    ats = [get_author_type(json_pl, p) for p in paths ]
+    # The name is the same for both paths, so it is only extracted once
+    author_name = get_author_name(json_pl)
+    ats = [get_author_type(json_pl, path, author_name) for path in AUTHOR_TYPE_PATHS]
 
     author_types = []
 
     for author_type in ats:
-        with g.lock:
-            is_new_author_type = author_type not in g.author_types_dict
-            if is_new_author_type:
-                g.author_types_dict[author_type] = g.author_types_id_counter
-                g.author_types_id_counter += 1
-
-            author_type_id = g.author_types_dict[author_type]
-            author_types.append((is_new_author_type, Author_Type(author_type_id, author_type)))
+        author_type = sys.intern(author_type) if author_type else author_type
+        is_new_author_type, author_type_id = g.author_types_dict[author_type]
+        author_types.append((is_new_author_type, Author_Type(author_type_id, author_type)))
 
     return author_types
 
@@ -307,15 +313,79 @@ def generate_author_type_evolution(author_types: List[Author_Type], author_id: s
         - This function **does not modify the database**; it returns structured data.
     """
     at_ids = [a.author_type_id for _, a in author_types]
-    now = dt.datetime.now(pytz.timezone("Europe/Vienna")).isoformat()
+    now = dt.datetime.now(VIENNA_TZ).isoformat()
     return Author_Type_Evolution(author_id, at_ids[0], at_ids[1], now)
 
+def extract_author_page_rows(
+    get_connection: SQLite3ConnectionGenerator, 
+    url_id: int, 
+    html: bytes, 
+    author_id: str, 
+    verbose: bool = False
+    ) -> List[DatabaseRow]:
+    """
+    Extracts every database row of an already fetched author page, without inserting them.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection (failures are logged).
+        url_id (int): 
+            A unique identifier for the URL.
+        html (bytes): 
+            The raw HTML of the author's profile page.
+        author_id (str): 
+            The unique identifier for the author.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
+
+    Returns:
+        List[DatabaseRow]: 
+            - `[authors_bio, author_type_evolution, *new_author_types]` if everything was parsed.
+            - `[authors_bio]` if the author types couldn't be parsed.
+            - An empty list if the JSON metadata or the biography couldn't be parsed.
+
+    Process:
+        1. **Parses the JSON metadata** with `extract_json_data()`.
+        2. **Extracts the author's biography** (`scrape_authors_bio()`).
+        3. **Extracts author roles** (`scrape_authors_type()`).
+        4. **Tracks role changes** (`generate_author_type_evolution()`).
+
+    Notes:
+        - Author type IDs are assigned here, through `g.author_types_dict`, so the newly 
+          discovered roles returned must be inserted (see `scrape_authors_page()`).
+    """
+    json_preload = extract_json_data(get_connection, url_id, html, verbose=verbose)
+
+    if json_preload is None:
+        return []
+
+    try:
+        authors_bio = scrape_authors_bio(json_preload, author_id)
+    except AUTHOR_PAGE_ERRORS as e:
+        message = general.error_message(e, verbose)
+        db.log_event(get_connection, url_id=url_id, process=f'Failed at parsing bio from author id {author_id}', success=0, message=message)
+        return []
+
+    try:
+        author_types = scrape_authors_type(json_preload) # returns List of tuples (is_new_author_type:bool, Author_Type:namedtuple)
+    except AUTHOR_PAGE_ERRORS as e:
+        message = general.error_message(e, verbose)
+        db.log_event(get_connection, url_id=url_id, process=f'Failed at parsing author_type from author id {author_id}', success=0, message=message)
+        return [authors_bio]
+
+    author_type_evolution = generate_author_type_evolution(author_types, author_id)
+    new_author_types = [author_type for is_new, author_type in author_types if is_new]
+
+    return [authors_bio, author_type_evolution, *new_author_types]
+
 def scrape_authors_page(
     get_connection: SQLite3ConnectionGenerator, 
     url_id: int, 
     url: str, 
     author_id: str, 
-    timeout: float = 0.5
+    timeout: float = 0.5,
+    verbose: bool = False
     ) -> None:
     """
     Scrapes and processes an author's profile page.
@@ -336,20 +406,18 @@ def scrape_authors_page(
             The unique identifier for the author.
         timeout (float, optional): 
             The timeout in seconds before retrying a failed request. Defaults to `0.5`.
+        verbose (bool, optional): 
+            If `True`, failures are logged with their full traceback; otherwise only 
+            with the exception type and message. Defaults to `False`.
 
     Returns:
         None: This function does not return a value but logs failures if they occur.
 
     Process:
-        1. **Fetches and parses JSON metadata** from the author's page.
-        2. **Extracts the author's biography** (`scrape_authors_bio()`).
-        3. **Logs and exits if biography extraction fails**.
-        4. **Inserts biography data** into the database.
-        5. **Extracts author roles** (`scrape_authors_type()`).
-        6. **Logs and exits if role extraction fails**.
-        7. **Tracks role changes** (`generate_author_type_evolution()`).
-        8. **Inserts role evolution data** into the database.
-        9. **Inserts newly discovered roles** into the database.
+        1. **Fetches the author's page** with `general.fetch_url()`.
+        2. **Extracts the rows of the page** with `extract_author_page_rows()`.
+        3. **Inserts the biography, the role evolution and the newly discovered roles** 
+           with a single `db.insert_named_tuples()` call, i.e. in one transaction.
 
     Example:
         ```python
@@ -357,38 +425,18 @@ def scrape_authors_page(
         ```
 
     Notes:
-        - If **JSON extraction fails**, the function exits early without processing further.
-        - If **biography extraction fails**, a log entry is created, and the function exits.
-        - Uses `db.insert_named_tuple()` to insert extracted data.
-        - The function **ensures that newly discovered roles** are tracked and stored.
+        - If **JSON or biography extraction fails**, nothing is inserted.
+        - If **role extraction fails**, the biography is inserted alone.
 
     Raises:
-        Exception: Any unexpected error is logged, and the function exits early.
+        Exception: Errors other than `AUTHOR_PAGE_ERRORS` are not caught.
     """
-    json_preload = scrape_json_data(get_connection, url_id, url, timeout=timeout)
+    page = general.fetch_url(get_connection, url=url, timeout=timeout)
 
-    if json_preload is None:
+    if page is None:
         return
 
-    try:
-        authors_bio = scrape_authors_bio(json_preload, author_id)
-    except:
-        message = traceback.format_exc()
-        db.log_event(get_connection, url_id=url_id, process=f'Failed at parsing bio from author id {author_id}', success=0, message=message)
-        return
-
-    db.insert_named_tuple(get_connection, authors_bio)
-
-    try:
-        author_types = scrape_authors_type(json_preload) # returns List of tuples (is_new_author_type:bool, Author_Type:namedtuple)
-    except:
-        message = traceback.format_exc()
-        db.log_event(get_connection, url_id=url_id, process=f'Failed at parsing author_type from author id {author_id}', success=0, message=message)
-        return
-
-    author_type_evolution = generate_author_type_evolution(author_types, author_id)
-    db.insert_named_tuple(get_connection,author_type_evolution)
+    rows = extract_author_page_rows(get_connection, url_id, page.content, author_id, verbose=verbose)
 
-    for is_new, author_type in author_types:
-        if is_new:
-            db.insert_named_tuple(get_connection,author_type)
+    # Everything scraped from the page is committed in a single transaction
+    db.insert_named_tuples(get_connection, rows)
@@ -1,32 +1,44 @@
 from __future__ import annotations
+import os
 import time
+import queue
+import atexit
 import sqlite3
+import threading
 import traceback
-import pandas as pd
+import functools
+import itertools
 
 from pathlib import Path
+from contextlib import closing, contextmanager
 
 from . import globals as g
-from .types import *
-from typing import Dict, Any, Optional, List, Optional, Tuple
+from .types import (
+    URL, Label, Genre, Keyword, Entity, Artist, Author, Author_Type, scraping_events, 
+    SQLite3ConnectionGenerator, DatabaseRow, TSCDict)
+from typing import Dict, Any, Optional, List, Tuple, Sequence, Union, Iterator
 
 functions = [
-    'initialize_database', 'execute_command', 'execute_script', 
-    'insert_named_tuple', 'insert_named_tuples', 'log_event']
+    'initialize_database', 'execute_command', 'execute_script', 'bulk_load_context', 
+    'insert_named_tuple', 'insert_named_tuples', 'log_event', 'flush']
 
 __all__ = functions
 
+# The lookup tables (id -> name) are stored `WITHOUT ROWID`, clustered on their id: 
+# a single B-tree per table, instead of the rowid table plus an index on the id.
+# `urls.url_id` is an alias of the rowid. `albums` keeps its rowid: a `WITHOUT ROWID` table makes 
+# its primary key NOT NULL, and reviews whose JSON has no `albumId` still get their album row
 DB_TABLES = {
-    'entities' : '(entity_id INTEGER, entity TEXT)',
-    'genres' : '(genre_id INTEGER, genre TEXT)',
-    'keywords' : '(keyword_id INTEGER, keyword TEXT)',
-    'labels' : '(label_id INTEGER, label TEXT)',
-    'urls' : '(url_id INTEGER, url TEXT)',
-    'albums' : '(album_id TEXT, album TEXT, publisher TEXT, release_year INTEGER, pitchfork_score INTEGER, is_best_new_music INTEGER, is_best_new_reissue INTEGER)',
+    'entities' : '(entity_id INTEGER PRIMARY KEY, entity TEXT) WITHOUT ROWID',
+    'genres' : '(genre_id INTEGER PRIMARY KEY, genre TEXT) WITHOUT ROWID',
+    'keywords' : '(keyword_id INTEGER PRIMARY KEY, keyword TEXT) WITHOUT ROWID',
+    'labels' : '(label_id INTEGER PRIMARY KEY, label TEXT) WITHOUT ROWID',
+    'urls' : '(url_id INTEGER PRIMARY KEY, url TEXT)',
+    'albums' : '(album_id TEXT PRIMARY KEY, album TEXT, publisher TEXT, release_year INTEGER, pitchfork_score INTEGER, is_best_new_music INTEGER, is_best_new_reissue INTEGER)',
     'artists' : '(artist_id INTEGER, artist TEXT, url_id TEXT)',
     'authors' : '(author_id TEXT, author TEXT, url_id TEXT)',
     'author_bios' : '(author_id TEXT, date_pub TEXT, revisions INTEGER, bio TEXT)',
-    'author_types' : '(author_type_id INTEGER, author_type TEXT)',
+    'author_types' : '(author_type_id INTEGER PRIMARY KEY, author_type TEXT) WITHOUT ROWID',
     'author_type_evolution' : '(author_id TEXT, author_type1_id INTEGER, author_type2_id INTEGER, as_of_date TEXT)',
     'reviews' : '(review_id TEXT, revisions INTEGER, url_id TEXT, body TEXT, description TEXT, date_pub TEXT, date_mod TEXT)',
     'review_albums' : '(review_id TEXT, album_id TEXT)',
@@ -39,6 +51,51 @@ DB_TABLES = {
     'scraping_events': '(timestamp TEXT, url_id INTEGER, process TEXT, success INTEGER, message TEXT)',
     'metadata' : '(table_name TEXT, column_name TEXT, is_primary_key INTEGER, is_foreign_key INTEGER, description TEXT)',}
 
+# Connections kept open for reuse, per mode (read-write / read-only), by each `get_connection`
+CONNECTION_POOL_SIZE = os.cpu_count() or 4
+
+# Compiled statements kept by each connection (`sqlite3.connect(cached_statements=...)`, default 128), 
+# enough for the INSERT of every table plus the queries of the scrapers and SQL scripts
+STATEMENT_CACHE_SIZE = 256
+
+# `PRAGMA synchronous` of the read-write connections, per `initialize_database(durability=...)`.
+# Under WAL, 'normal' only syncs at checkpoints: a power loss may drop the last commits, but never corrupts the file
+SYNCHRONOUS_MODES = {'normal': 'NORMAL', 'full': 'FULL'}
+
+# Page size of new database files (SQLite's default is 4096). It can only be set before the file is 
+# written, so `PRAGMA page_size` is a no-op on an existing database
+PAGE_SIZE = 8192
+
+# Rows of one table inserted by a single multi-row `INSERT ... VALUES (...), (...), ...` statement, 
+# capped so it never binds more than `MAX_SQL_PARAMETERS` values (SQLite's historical default limit). 
+# Multi-row VALUES needs SQLite 3.7.11; older versions only use `executemany`
+MULTI_ROW_INSERT_ROWS = 50
+MAX_SQL_PARAMETERS = 999
+MULTI_ROW_INSERTS = sqlite3.sqlite_version_info >= (3, 7, 11)
+
+# Pages the WAL may grow to before SQLite checkpoints it back into the database
+WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Indexes created by `__create_indexes`: (name, table, columns[, UNIQUE])
+DB_INDEXES = [
+    ("idx_artists", "artists", ("artist_id",)),
+    ("idx_author_bios", "author_bios", ("author_id",)),
+    ("idx_author_type_evolution", "author_type_evolution", ("author_id", "as_of_date")),
+    # Each author type is stored once; NULL (the null type) doesn't count as a duplicate
+    ("ux_author_types_name", "author_types", ("author_type",), True),
+    ("idx_authors", "authors", ("author_id",)),
+    ("idx_review_albums", "review_albums", ("review_id", "album_id")),
+    ("idx_review_artist_genres", "review_artist_genres", ("review_id", "artist_id", "genre_id")),
+    ("idx_review_artists", "review_artists", ("review_id", "artist_id")),
+    ("idx_review_authors", "review_authors", ("review_id", "author_id")),
+    ("idx_review_entities", "review_entities", ("review_id", "entity_id")),
+    ("idx_review_labels", "review_labels", ("review_id", "label_id")),
+    ("idx_reviews", "reviews", ("review_id",)),
+    ("idx_reviews_url", "reviews", ("url_id",)),
+    ("idx_scraping_events", "scraping_events", ("timestamp",)),
+    # Finding the urls of a given process (e.g. the pages that couldn't be fetched) is a range lookup
+    ("idx_scraping_events_process", "scraping_events", ("process", "url_id")),
+    ("idx_metadata", "metadata", ("table_name", "column_name"))]
 
 def __reset_tables(get_connection: SQLite3ConnectionGenerator, tables: Dict[str, str]) -> None:
     """
@@ -69,66 +126,75 @@ def __reset_tables(get_connection: SQLite3ConnectionGenerator, tables: Dict[str,
         - This function **irreversibly deletes** all data in the specified tables.
         - Ensure `get_connection()` provides an **open SQLite connection**.
         - The function executes raw SQL, so avoid passing untrusted table names.
+        - All the tables are reset in a **single transaction**: either all of them or none are.
 
     Returns:
         None: This function does not return a value.
     """
+    # Every table is dropped (with its indexes) and recreated in a single transaction, i.e. one commit
+    script = '\n'.join(f"DROP TABLE IF EXISTS {name};\nCREATE TABLE {name} {cols};" for name, cols in tables.items())
+    with closing(get_connection()) as con:
+        con.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+
+def __create_missing_tables(get_connection: SQLite3ConnectionGenerator, tables: Dict[str, str]) -> None:
+    """
+    Creates the tables of `tables` that don't exist yet, leaving the existing ones untouched.
+
+    Lets a database created by an older version of the scraper be resumed (`hard_reset=False`) 
+    after a table was added to `DB_TABLES`.
+    """
     con = get_connection()
-    cur = con.cursor()
     for name, cols in tables.items():
-        cur.execute(f"DROP TABLE IF EXISTS {name}")  # Delete existing table
-        cur.execute(f"CREATE TABLE {name} {cols};")  # Recreate with new schema
-    con.close()  # Ensure connection is closed properly
+        con.execute(f"CREATE TABLE IF NOT EXISTS {name} {cols};")
+    con.commit()
+    con.close()
 
-def __create_index_if_missing(
-    get_connection:SQLite3ConnectionGenerator, 
+def __create_index_sql(
     index_name:str, 
     table_name:str, 
-    columns:Tuple[str]) -> None:
+    columns:Sequence[str],
+    unique:bool = False) -> str:
     """
-    Creates an index on a table if it does not already exist.
+    Builds the statement that creates an index on a table if it does not already exist.
 
-    This function checks whether the specified index exists in the SQLite database.
-    If the index is missing, it creates a new index on the specified table and columns.
+    The statement is a `CREATE INDEX IF NOT EXISTS`, so SQLite itself skips 
+    the indexes that already exist, without querying `sqlite_master` first.
 
     Args:
-        get_connection (Callable[[], sqlite3.Connection]): 
-            A function that returns a new SQLite connection object.
         index_name (str): 
             The name of the index to be created.
         table_name (str): 
             The name of the table where the index should be applied.
-        columns (tuple[str, ...]): 
-            A tuple of column names (as strings) to include in the index.
+        columns (Sequence[str]): 
+            The column names (or expressions) to include in the index, in order.
+        unique (bool, optional): 
+            If `True`, creates a `UNIQUE` index, so SQLite rejects duplicated values. Defaults to `False`.
 
     Example:
         ```python
-        __create_index_if_missing(get_connection, "idx_users_name", "users", ("name", "email"))
+        __create_index_sql("idx_users_name", "users", ("name", "email"))
+        # 'CREATE INDEX IF NOT EXISTS idx_users_name ON users (name, email);'
         ```
 
     Notes:
-        - This function **ensures the index is not duplicated** before creating it.
-        - Using **parameterized queries** prevents SQL injection risks.
+        - This function **ensures the index is not duplicated** (`IF NOT EXISTS`).
+        - Index, table and column names can't be bound as SQL parameters, so they come 
+          from `__create_indexes`, never from scraped data.
         - Index creation **should be done carefully** for large tables, as it can impact performance.
 
     Returns:
-        None: This function does not return a value.
+        str: The `CREATE INDEX` statement.
     """
-    with get_connection() as con:
-        cur = con.cursor()
-        cur.execute("SELECT name FROM sqlite_master WHERE type='index' AND name=?;", (index_name,))
-
-        if not cur.fetchone():
-            cur.execute(f"CREATE INDEX {index_name} ON {table_name} ({columns});")
-            con.commit()
+    kind = 'UNIQUE INDEX' if unique else 'INDEX'
+    return f"CREATE {kind} IF NOT EXISTS {index_name} ON {table_name} ({', '.join(columns)});"
 
 def __create_indexes(get_connection:SQLite3ConnectionGenerator) -> None:
     """
     Creates missing indexes in the SQLite database.
 
-    This function iterates over a predefined list of index specifications 
-    and ensures that each index exists in the database. If an index is missing, 
-    it is created using `__create_index_if_missing`.
+    This function builds a `CREATE INDEX IF NOT EXISTS` statement for each of the 
+    index specifications in `DB_INDEXES` (`__create_index_sql`), and runs them 
+    all as a single script, in one transaction, so only the missing indexes are created.
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
@@ -138,35 +204,16 @@ def __create_indexes(get_connection:SQLite3ConnectionGenerator) -> None:
         - Indexes improve query performance by allowing faster lookups.
         - This function does not drop or modify existing indexes.
         - Multi-column indexes are included where necessary.
+        - An index spec may carry a fourth element, `True` for a `UNIQUE` index.
 
     Returns:
         None: This function does not return a value.
 
     """
-    index_list = [
-        ("idx_urls", "urls", "url_id"),
-        ("idx_albums", "albums", "album_id"),
-        ("idx_artists", "artists", "artist_id"),
-        ("idx_author_bios", "author_bios", "author_id"),
-        ("idx_author_type_evolution", "author_type_evolution", "author_id, as_of_date"),
-        ("idx_author_types", "author_types", "author_type_id"),
-        ("idx_authors", "authors", "author_id"),
-        ("idx_entities", "entities", "entity_id"),
-        ("idx_genres", "genres", "genre_id"),
-        ("idx_keywords", "keywords", "keyword_id"),
-        ("idx_labels", "labels", "label_id"),
-        ("idx_review_albums", "review_albums", "review_id, album_id"),
-        ("idx_review_artist_genres", "review_artist_genres", "review_id, artist_id, genre_id"),
-        ("idx_review_artists", "review_artists", "review_id, artist_id"),
-        ("idx_review_authors", "review_authors", "review_id, author_id"),
-        ("idx_review_entities", "review_entities", "review_id, entity_id"),
-        ("idx_review_labels", "review_labels", "review_id, label_id"),
-        ("idx_reviews", "reviews", "review_id"),
-        ("idx_scraping_events", "scraping_events", "timestamp"),
-        ("idx_metadata", "metadata", "table_name, column_name")]
-
-    for index in index_list:
-        __create_index_if_missing(get_connection, *index)
+    # A single script, run in one transaction, instead of a connection and a commit per index
+    script = '\n'.join(__create_index_sql(*index) for index in DB_INDEXES)
+    with closing(get_connection()) as con:
+        con.executescript(f"BEGIN;\n{script}\nCOMMIT;")
 
 def __create_null_types(get_connection:SQLite3ConnectionGenerator) -> None:
     """
@@ -218,36 +265,30 @@ def __initialize_globals(get_connection:SQLite3ConnectionGenerator) -> None:
     Global Variables Set:
         - `g.albums_set (Set[int])`: Set of all `album_id`s.
         - `g.authors_set (Set[int])`: Set of all `author_id`s.
-        - `g.urls_dict (Dict[str, int])`: Maps `url` to `url_id`.
-        - `g.artists_dict (Dict[str, int])`: Maps `artist` to `artist_id`.
-        - `g.labels_dict (Dict[str, int])`: Maps `label` to `label_id`.
-        - `g.genres_dict (Dict[str, int])`: Maps `genre` to `genre_id`.
-        - `g.keywords_dict (Dict[str, int])`: Maps `keyword` to `keyword_id`.
-        - `g.entities_dict (Dict[str, int])`: Maps `entity` to `entity_id`.
-        - `g.author_types_dict (Dict[str, int])`: Maps `author_type` to `author_type_id`.
+        - `g.urls_dict (TSCDict)`: Maps `url` to `url_id`.
+        - `g.artists_dict (TSCDict)`: Maps `artist` to `artist_id`.
+        - `g.labels_dict (TSCDict)`: Maps `label` to `label_id`.
+        - `g.genres_dict (TSCDict)`: Maps `genre` to `genre_id`.
+        - `g.keywords_dict (TSCDict)`: Maps `keyword` to `keyword_id`.
+        - `g.entities_dict (TSCDict)`: Maps `entity` to `entity_id`.
+        - `g.author_types_dict (TSCDict)`: Maps `author_type` to `author_type_id`.
 
     Returns:
         None: This function does not return a value.
     """
 
-    with get_connection() as con:
-        g.albums_set = set(pd.read_sql("SELECT album_id FROM albums", con)['album_id'].unique())
-        g.authors_set = set(pd.read_sql("SELECT author_id FROM authors", con)['author_id'].unique())
-        g.urls_dict = pd.read_sql("SELECT url_id, url FROM urls", con, index_col='url')['url_id'].to_dict()
-        g.artists_dict = pd.read_sql("SELECT artist_id, artist FROM artists", con, index_col='artist')['artist_id'].to_dict()
-        g.labels_dict = pd.read_sql("SELECT label_id, label FROM labels", con, index_col='label')['label_id'].to_dict()
-        g.genres_dict = pd.read_sql("SELECT genre_id, genre FROM genres", con, index_col='genre')['genre_id'].to_dict()
-        g.keywords_dict = pd.read_sql("SELECT keyword_id, keyword FROM keywords", con, index_col='keyword')['keyword_id'].to_dict()
-        g.entities_dict = pd.read_sql("SELECT entity_id, entity FROM entities", con, index_col='entity')['entity_id'].to_dict()
-        g.author_types_dict = pd.read_sql("SELECT author_type_id, author_type FROM author_types", con, index_col='author_type')['author_type_id'].to_dict()
-
-        g.urls_id_counter = max(g.urls_dict.values()) + 1
-        g.artists_id_counter = max(g.artists_dict.values()) + 1
-        g.labels_id_counter = max(g.labels_dict.values()) + 1
-        g.genres_id_counter = max(g.genres_dict.values()) + 1
-        g.keywords_id_counter = max(g.keywords_dict.values()) + 1
-        g.entities_id_counter = max(g.entities_dict.values()) + 1
-        g.author_types_id_counter = max(g.author_types_dict.values()) + 1
+    # Only reads, so it gets a read-only connection (`mode=ro`), with its own page cache and mmap
+    with closing(get_connection(read_only=True)) as con:
+        # The cursors are iterated straight into sets / dicts (`SELECT key, id` rows are `(key, id)` pairs)
+        g.albums_set = {album_id for album_id, in con.execute("SELECT album_id FROM albums")}
+        g.authors_set = {author_id for author_id, in con.execute("SELECT author_id FROM authors")}
+        g.urls_dict = TSCDict(con.execute("SELECT url, url_id FROM urls"))
+        g.artists_dict = TSCDict(con.execute("SELECT artist, artist_id FROM artists"))
+        g.labels_dict = TSCDict(con.execute("SELECT label, label_id FROM labels"))
+        g.genres_dict = TSCDict(con.execute("SELECT genre, genre_id FROM genres"))
+        g.keywords_dict = TSCDict(con.execute("SELECT keyword, keyword_id FROM keywords"))
+        g.entities_dict = TSCDict(con.execute("SELECT entity, entity_id FROM entities"))
+        g.author_types_dict = TSCDict(con.execute("SELECT author_type, author_type_id FROM author_types"))
 
 def __check_filepath(filepath: Union[str, Path, None] = None) -> Path:
     """
@@ -280,7 +321,268 @@ def __check_filepath(filepath: Union[str, Path, None] = None) -> Path:
 
     return filepath
 
-def initialize_database(db_name: str, filepath: Union[str | Path | None] = None, hard_reset: bool = False) -> SQLite3ConnectionGenerator:
+@functools.lru_cache(maxsize=None)
+def _insert_sql(row_type: type) -> str:
+    """
+    Builds the parameterized `INSERT` statement for a namedtuple class.
+
+    The namedtuple's class name is used as the table name and its fields as column names. 
+    The statement is built once per class and cached, so the SQL string is identical on 
+    every call and SQLite's statement cache always hits.
+    """
+    table = row_type.__name__       # Get table name from namedtuple class
+    fields = row_type._fields       # Extract column names
+    field_placeholders = ', '.join(['?'] * len(fields))  # Create parameterized placeholders
+    return f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({field_placeholders});"
+
+def __error_message(error: Exception) -> str:
+    """
+    Formats a failed insert for `scraping_events` as `"ExceptionType: message"`. Inserts can 
+    fail by the thousands (e.g. constraint violations), and formatting a full traceback 
+    for each one would cost more than the insert itself.
+    """
+    return f'{type(error).__name__}: {error}'
+
+def _multi_row_size(row_type: type) -> int:
+    """Rows of `row_type` inserted per multi-row statement (`1` if multi-row inserts are disabled)."""
+    if not MULTI_ROW_INSERTS:
+        return 1
+    return max(1, min(MULTI_ROW_INSERT_ROWS, MAX_SQL_PARAMETERS // len(row_type._fields)))
+
+@functools.lru_cache(maxsize=None)
+def _insert_many_sql(row_type: type) -> str:
+    """
+    Builds the multi-row variant of `_insert_sql(row_type)`, inserting `_multi_row_size(row_type)` 
+    rows at once: `INSERT INTO t (a, b) VALUES (?, ?), (?, ?), ...;`. Cached like `_insert_sql`.
+    """
+    single = _insert_sql(row_type)
+    head, _, values = single.rpartition(' VALUES ')
+    values = values.rstrip(';')
+    return f"{head} VALUES {', '.join([values] * _multi_row_size(row_type))};"
+
+def _insert_rows(con: sqlite3.Connection, row_type: type, rows: List[DatabaseRow]) -> None:
+    """
+    Inserts `rows` (all of them of `row_type`) with as few statement executions as possible.
+
+    Full chunks of `_multi_row_size(row_type)` rows go through the multi-row statement of 
+    `_insert_many_sql()`, one execution per chunk; the remaining rows through `executemany`. 
+    Chunks always have the same size, so there is a single multi-row statement per table 
+    to keep compiled.
+    """
+    size = _multi_row_size(row_type)
+    num_multi = (len(rows) // size) * size if size > 1 else 0
+
+    if num_multi:
+        sql = _insert_many_sql(row_type)
+        for start in range(0, num_multi, size):
+            con.execute(sql, tuple(itertools.chain.from_iterable(rows[start:start + size])))
+
+    if num_multi < len(rows):
+        con.executemany(_insert_sql(row_type), rows[num_multi:])
+
+def __log_failed_insert(con: sqlite3.Connection, row_type: type, error: Exception) -> None:
+    """Records a row of `row_type` that couldn't be inserted in `scraping_events`, through `con`."""
+    event = scraping_events(
+        timestamp=scraping_events.default_timestamp(), 
+        process=f"Failed at inserting data into {row_type.__name__}", 
+        success=0, 
+        message=__error_message(error))
+    con.execute(_insert_sql(scraping_events), event)
+
+def _write_units(con: sqlite3.Connection, units: List[List[DatabaseRow]], log: bool = True) -> None:
+    """
+    Inserts every unit of rows in a single transaction, each unit inside its own `SAVEPOINT`.
+
+    A unit is the list of rows handed over by one call to `insert_named_tuples` (e.g. every 
+    row of one album review). Its rows are grouped by table and inserted with `_insert_rows`, 
+    i.e. multi-row `INSERT`s plus one `executemany` for the leftover rows of each table. 
+    If any of them fails, only that unit is rolled back, and its rows are inserted again 
+    one by one: the IDs of its lookup rows were already assigned by the `TSCDict`s, so they 
+    must be written even if another row of the unit is rejected. Only the offending rows 
+    are lost, and they are logged to `scraping_events` if `log=True`.
+
+    `con` must be in autocommit mode (`isolation_level=None`), since the transaction is 
+    opened explicitly with `BEGIN IMMEDIATE`.
+    """
+    if not units:
+        return
+
+    con.execute("BEGIN IMMEDIATE;")
+    try:
+        for unit in units:
+            tables: Dict[type, List[DatabaseRow]] = {}
+            for row in unit:
+                tables.setdefault(type(row), []).append(row)
+
+            con.execute("SAVEPOINT unit;")
+            try:
+                for row_type, table_rows in tables.items():
+                    _insert_rows(con, row_type, table_rows)
+            except sqlite3.DatabaseError:
+                con.execute("ROLLBACK TO unit;")
+                # The IDs of the unit's lookup rows (labels, urls, artists...) are already handed 
+                # out, so they must still land: retry row by row and only drop the offending rows
+                for row in unit:
+                    try:
+                        con.execute(_insert_sql(type(row)), row)
+                    except sqlite3.DatabaseError as e:
+                        if log:
+                            __log_failed_insert(con, type(row), e)
+            con.execute("RELEASE unit;")
+        con.execute("COMMIT;")
+    except:
+        if con.in_transaction:
+            con.execute("ROLLBACK;")
+        raise
+
+class DatabaseWriter(threading.Thread):
+    """
+    Background thread that owns the only read-write SQLite connection.
+
+    Scraping threads hand their rows to the writer through a queue instead of 
+    opening their own connections, so SQLite never has competing writers and the 
+    scraping threads never wait on the database lock. The writer collects whatever 
+    is queued for up to `flush_interval` seconds and commits it in a single 
+    `BEGIN IMMEDIATE ... COMMIT` transaction (see `_write_units`).
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection. It is called once, from the writer thread.
+        flush_interval (float, optional): 
+            The time (in seconds) to wait for more rows before committing a batch. 
+            Defaults to `0.2`.
+        batch_size (int, optional): 
+            The number of rows after which a batch is committed without waiting. 
+            Defaults to `500`.
+
+    Notes:
+        - Each queued item is a list of rows, which is written atomically inside its own `SAVEPOINT`.
+        - If an item fails, only its rows are rolled back, and the failure is 
+          logged to `scraping_events`, like `insert_named_tuple` does.
+        - `flush()` blocks until every queued row has been committed.
+        - `close()` also runs `PRAGMA optimize;`, once everything has been written.
+
+    Example:
+        ```python
+        writer = DatabaseWriter(get_connection)
+        writer.start()
+        writer.put([URL(1, "https://pitchfork.com/")])
+        writer.flush()
+        ```
+    """
+    def __init__(self, get_connection: SQLite3ConnectionGenerator, flush_interval: float = 0.2, batch_size: int = 500):
+        super().__init__(name='sqlite-writer', daemon=True)
+        self.get_connection = get_connection
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+
+    def put(self, rows: List[DatabaseRow]) -> None:
+        """Queues `rows` to be committed together."""
+        self.queue.put(rows)
+
+    def flush(self) -> None:
+        """Blocks until every queued row has been committed."""
+        self.queue.join()
+
+    def close(self) -> None:
+        """Commits the pending rows and stops the thread."""
+        self.queue.put(None)
+        self.join()
+
+    def run(self) -> None:
+        con = self.get_connection()
+        con.isolation_level = None  # Transactions are handled explicitly
+
+        running = True
+        while running:
+            items = [self.queue.get()]
+            num_rows = len(items[0] or [])
+            deadline = time.monotonic() + self.flush_interval
+
+            while (items[-1] is not None) and (num_rows < self.batch_size):
+                try:
+                    items.append(self.queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+                num_rows += len(items[-1] or [])
+
+            running = items[-1] is not None
+            try:
+                _write_units(con, [item for item in items if item])
+            except Exception:
+                traceback.print_exc()  # The writer must survive, otherwise flush() would block forever
+            finally:
+                for _ in items:
+                    self.queue.task_done()
+
+        # Refreshes the planner's statistics of the tables written in this run, as SQLite recommends 
+        # before closing a connection, so the next run on this database (e.g. a resume) starts with them
+        try:
+            con.execute("PRAGMA optimize;")
+        except sqlite3.DatabaseError:
+            traceback.print_exc()
+        con.close()
+
+writer: Optional[DatabaseWriter] = None
+
+def flush() -> None:
+    """
+    Blocks until the background writer has committed every queued row.
+
+    Call it before reading back data that scraping threads have just inserted 
+    (e.g. before querying the failed URLs or running the SQL scripts).
+    """
+    if writer is not None:
+        writer.flush()
+
+def close_writer() -> None:
+    """
+    Commits the pending rows and stops the background writer, if there is one.
+
+    It is registered with `atexit`, so queued rows are not lost when a script ends.
+    """
+    global writer
+    if writer is not None:
+        writer.close()
+        writer = None
+
+atexit.register(close_writer)
+
+class PooledConnection(sqlite3.Connection):
+    """
+    An SQLite connection that goes back to its pool when closed, instead of being closed.
+
+    It is what `get_connection` returns, so the callers' usual `con.close()` (or `closing(con)`) 
+    hands the connection over to the next caller, with its PRAGMAs already applied, and the 
+    scrapers don't pay for opening a connection each time they log an event or read a row.
+
+    Notes:
+        - A transaction left open is rolled back, and `isolation_level` / `row_factory` are reset, 
+          before the connection is pooled.
+        - If the pool is full, the connection is really closed.
+    """
+    pool: Optional[queue.LifoQueue] = None
+
+    def close(self) -> None:
+        if self.pool is not None:
+            if self.in_transaction:
+                self.rollback()
+            self.isolation_level = ''
+            self.row_factory = None
+            try:
+                self.pool.put_nowait(self)
+                return
+            except queue.Full:
+                pass
+        super().close()
+
+def initialize_database(
+    db_name: str, 
+    filepath: Union[str | Path | None] = None, 
+    hard_reset: bool = False, 
+    durability: str = 'normal'
+    ) -> SQLite3ConnectionGenerator:
     """
     Initializes an SQLite database and returns a connection generator.
 
@@ -297,21 +599,39 @@ def initialize_database(db_name: str, filepath: Union[str | Path | None] = None,
         hard_reset (bool, optional): 
             If `True`, resets all tables, indexes, and inserts null types. 
             Defaults to `False`.
+        durability (str, optional): 
+            `'normal'` (`PRAGMA synchronous=NORMAL`) or `'full'` (`PRAGMA synchronous=FULL`, 
+            which syncs on every commit). Defaults to `'normal'`.
 
     Returns:
         SQLite3ConnectionGenerator: 
-            A function that returns an open SQLite connection.
+            A function that returns an open SQLite connection. Call it with 
+            `read_only=True` to get a read-only connection for queries.
+
+    Raises:
+        ValueError: If `durability` is not one of `SYNCHRONOUS_MODES`.
 
     Notes:
+        - All inserts go through a single background `DatabaseWriter`, started here. 
+          Use `flush()` before reading rows that were just inserted.
         - The database connection uses:
-            - **WAL mode (`PRAGMA journal_mode=WAL;`)** for concurrent reads/writes.
-            - **`PRAGMA synchronous=FULL;`** for durability (ensuring database safety).
+            - **WAL mode (`PRAGMA journal_mode=WAL;`)** for concurrent reads/writes. 
+              SQLite keeps `-wal` and `-shm` sidecar files next to the database while it is open.
+            - **`PRAGMA synchronous=NORMAL;`** (unless `durability='full'`), which is safe under WAL 
+              and only syncs at checkpoints, checkpointing every `WAL_AUTOCHECKPOINT_PAGES` pages.
+            - **`PRAGMA page_size`** of `PAGE_SIZE` bytes, for new database files only.
             - **`PRAGMA temp_store=MEMORY;`** for improved performance.
+            - **`PRAGMA mmap_size`** (256 MiB) and **`PRAGMA cache_size`** (64 MiB) to keep hot pages in memory.
+            - **`PRAGMA busy_timeout=30000;`** so writers wait inside SQLite instead of failing with `database is locked`.
+        - Closed connections are pooled (`PooledConnection`, up to `CONNECTION_POOL_SIZE` per mode) 
+          and handed out again, so the PRAGMAs are only applied when a connection is opened, 
+          and each one keeps up to `STATEMENT_CACHE_SIZE` compiled statements.
         - If `hard_reset=True`, it:
             1. **Resets all tables** (`__reset_tables`).
             2. **Creates indexes** (`__create_indexes`).
             3. **Inserts default null values** (`__create_null_types`).
-        - Otherwise, it **initializes global variables** (`__initialize_globals`).
+        - Otherwise, it **creates the missing tables and indexes** (`__create_missing_tables`, 
+          `__create_indexes`) and **initializes global variables** (`__initialize_globals`).
 
     Example:
         ```python
@@ -319,16 +639,40 @@ def initialize_database(db_name: str, filepath: Union[str | Path | None] = None,
         con = get_connection()  # Get a database connection
         ```
     """
+    global writer
+
+    if durability not in SYNCHRONOUS_MODES:
+        raise ValueError(f"durability must be one of {list(SYNCHRONOUS_MODES)}, not {durability!r}")
+    synchronous = SYNCHRONOUS_MODES[durability]
+
+    close_writer()
+
     filepath = __check_filepath(filepath)
 
     file = filepath / db_name
     hard_reset = hard_reset or (not file.exists())
 
-    def get_connection():
-        con = sqlite3.connect(file, check_same_thread=False)
-        con.execute("PRAGMA journal_mode=WAL;")
-        con.execute("PRAGMA synchronous=FULL;")
+    pools = {False: queue.LifoQueue(CONNECTION_POOL_SIZE), True: queue.LifoQueue(CONNECTION_POOL_SIZE)}
+
+    def get_connection(read_only: bool = False):
+        try:
+            return pools[read_only].get_nowait()
+        except queue.Empty:
+            pass
+
+        if read_only:
+            con = sqlite3.connect(f"{file.as_uri()}?mode=ro", uri=True, check_same_thread=False, factory=PooledConnection, cached_statements=STATEMENT_CACHE_SIZE)
+        else:
+            con = sqlite3.connect(file, check_same_thread=False, factory=PooledConnection, cached_statements=STATEMENT_CACHE_SIZE)
+            con.execute(f"PRAGMA page_size={PAGE_SIZE};")  # Before the WAL PRAGMA, which writes the file's header
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute(f"PRAGMA synchronous={synchronous};")
+            con.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES};")
         con.execute("PRAGMA temp_store=MEMORY;")
+        con.execute("PRAGMA mmap_size=268435456;")   # 256 MiB
+        con.execute("PRAGMA cache_size=-65536;")     # 64 MiB
+        con.execute("PRAGMA busy_timeout=30000;")    # 30 s
+        con.pool = pools[read_only]
         return con
 
     if hard_reset:
@@ -336,8 +680,13 @@ def initialize_database(db_name: str, filepath: Union[str | Path | None] = None,
         __create_indexes(get_connection)
         __create_null_types(get_connection)
     else:
+        __create_missing_tables(get_connection, DB_TABLES)
+        __create_indexes(get_connection) # Only the indexes added since the database was created
         __initialize_globals(get_connection)
 
+    writer = DatabaseWriter(get_connection)
+    writer.start()
+
     return get_connection
 
 def execute_script(get_connection:SQLite3ConnectionGenerator, script_path: Union[str | Path]) -> None:
@@ -357,7 +706,10 @@ def execute_script(get_connection:SQLite3ConnectionGenerator, script_path: Union
     Notes:
         - The SQL script is read as UTF-8 to ensure compatibility.
         - Uses `executescript` to execute multiple SQL statements in a single call.
-        - Automatically commits changes after execution.
+        - The whole script runs inside a single `BEGIN ... COMMIT` transaction: one commit 
+          instead of one per statement, and nothing is left half applied if a statement fails 
+          (the pooled connection rolls it back when closed).
+        - The script must not open or commit transactions itself.
 
     Example:
         ```python
@@ -373,11 +725,51 @@ def execute_script(get_connection:SQLite3ConnectionGenerator, script_path: Union
     if not script_file.exists():
         raise FileNotFoundError(f"SQL script not found: {script_path}")
 
-    with get_connection() as con:
-        cur = con.cursor()
-        sql_script = script_file.read_text(encoding="utf-8")  
-        cur.executescript(sql_script)
-        con.commit() 
+    sql_script = script_file.read_text(encoding="utf-8")
+
+    with closing(get_connection()) as con:
+        # The ';' closes the script's last statement, in case it has no trailing ';'
+        con.executescript(f"BEGIN;\n{sql_script}\n;\nCOMMIT;")
+
+@contextmanager
+def bulk_load_context(get_connection: SQLite3ConnectionGenerator) -> Iterator[None]:
+    """
+    Drops the indexes of `DB_INDEXES` for the duration of a bulk load, and rebuilds them afterwards.
+
+    Every inserted row has to update every index of its table. Without them, the rows are 
+    only appended, and each index is then rebuilt with a single sorted pass over its table.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection.
+
+    Example:
+        ```python
+        with bulk_load_context(get_connection):
+            execute_script(get_connection, "big_dump.sql")
+        ```
+
+    Notes:
+        - `UNIQUE` indexes are kept, since they enforce the data's integrity during the load.
+        - Queued rows are flushed (`flush()`) before the indexes are dropped and before they are rebuilt.
+        - Queries run inside the block can't use the dropped indexes; keep lookups out of it.
+        - The indexes are rebuilt, and `ANALYZE` refreshes the planner's statistics, even if the block raises.
+    """
+    flush()
+    # UNIQUE indexes (the fourth element of their spec) are kept
+    dropped = [index[0] for index in DB_INDEXES if not (len(index) > 3 and index[3])]
+    script = '\n'.join(f"DROP INDEX IF EXISTS {name};" for name in dropped)
+    with closing(get_connection()) as con:
+        con.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+
+    try:
+        yield
+    finally:
+        flush()
+        __create_indexes(get_connection)
+        with closing(get_connection()) as con:
+            con.execute("ANALYZE;")
+            con.commit()
 
 def execute_command(
     get_connection: SQLite3ConnectionGenerator, 
@@ -387,8 +779,8 @@ def execute_command(
     verbose:bool = False) -> None:
     """
     This function runs an SQL command using an SQLite connection, optionally 
-    with a database row for parameterized queries. If execution fails, it 
-    retries after a short delay.
+    with a database row for parameterized queries. If the database is still 
+    locked once `PRAGMA busy_timeout` runs out, it retries after a short delay.
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
@@ -399,7 +791,7 @@ def execute_command(
             A namedtuple representing a database row, used for parameterized queries. 
             Defaults to `None`.
         delay (float, optional): 
-            The time (in seconds) to wait before retrying if an error occurs. 
+            The time (in seconds) to wait before retrying if the database is locked. 
             Defaults to `0.2`.
 
     Returns:
@@ -407,9 +799,10 @@ def execute_command(
 
     Notes:
         - Uses **parameterized queries** (`cur.execute(cmd, row)`) to prevent SQL injection.
-        - **Automatically retries** in case of transient database errors.
+        - Waiting on a locked database is done inside SQLite (`PRAGMA busy_timeout`); only if that 
+          runs out is the command **retried**. Any other error is raised right away.
         - Commits changes after a successful execution.
-        - Uses `with get_connection()` to ensure proper resource cleanup.
+        - Uses `closing(get_connection())` so the connection goes back to the pool.
 
     Example:
         ```python
@@ -417,10 +810,10 @@ def execute_command(
         ```
 
     Raises:
-        sqlite3.DatabaseError: If a persistent SQL error occurs.
+        sqlite3.DatabaseError: If the command fails for any reason other than a locked database.
     """
     while True:
-        with get_connection() as con:
+        with closing(get_connection()) as con:
             try:
                 cur = con.cursor()
                 if row is None:
@@ -436,8 +829,15 @@ def execute_command(
                     cur.execute(cmd, row)
                 con.commit()
                 return
-            except sqlite3.DatabaseError as e:
-                time.sleep(delay)
+            except sqlite3.OperationalError as e:
+                if not __is_locked_error(e):
+                    raise
+        time.sleep(delay)
+
+def __is_locked_error(error: sqlite3.OperationalError) -> bool:
+    """Whether `error` is SQLite's `database is locked` / `database table is locked` / busy error."""
+    message = str(error)
+    return ('locked' in message) or ('busy' in message)
 
 def insert_named_tuple(
     get_connection: SQLite3ConnectionGenerator, 
@@ -458,6 +858,8 @@ def insert_named_tuple(
             is used as the table name, and its fields are used as column names.
         log (bool, optional): 
             If `True`, logs any failures to the database. Defaults to `True`.
+        verbose (bool, optional): 
+            If `True`, prints the insert and logs failures with their full traceback. Defaults to `False`.
 
     Returns:
         None: This function does not return a value.
@@ -465,7 +867,10 @@ def insert_named_tuple(
     Notes:
         - The function **constructs the SQL query dynamically** using the namedtuple's attributes.
         - Uses **parameterized queries** to prevent SQL injection risks.
-        - If an error occurs, it **logs the error message into the database** if `log=True`.
+        - If the background `writer` is running, the row is **queued** and committed by it; 
+          the writer always logs failed rows.
+        - If an error occurs, it **logs the error message into the database** if `log=True`: 
+          `"ExceptionType: message"`, or the full traceback if `verbose=True`.
 
     Example:
         ```python
@@ -479,21 +884,28 @@ def insert_named_tuple(
     if row is None:
         return
 
-    table = row.__class__.__name__  # Get table name from namedtuple class
-    fields = row._fields            # Extract column names
-    field_placeholders = ', '.join(['?'] * len(fields))  # Create parameterized placeholders
+    insert_cmd = _insert_sql(type(row))
+
+    if writer is not None:
+        if verbose:
+            print(f'About to queue:')
+            print(f'\t{insert_cmd}')
+            print(f'\t{row}')
+        writer.put([row])
+        return
 
-    insert_cmd = f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({field_placeholders});"
+    table = row.__class__.__name__
     try:
         execute_command(get_connection, insert_cmd, tuple(row), verbose=verbose)
-    except sqlite3.DatabaseError:
+    except sqlite3.DatabaseError as e:
         if log:
-            message = traceback.format_exc()
-            log_event(
-                get_connection, 
+            # Inserted with log=False: if logging fails as well, it isn't logged again (and again)
+            event = scraping_events(
+                timestamp=scraping_events.default_timestamp(), 
                 process=f"Failed at inserting data into {table}", 
                 success=0, 
-                message=message)
+                message=traceback.format_exc() if verbose else __error_message(e))
+            insert_named_tuple(get_connection, event, log=False)
 
 def insert_named_tuples(
     get_connection: SQLite3ConnectionGenerator, 
@@ -501,8 +913,8 @@ def insert_named_tuples(
     log: bool = True,
     verbose:bool=False) -> None:
     """
-    This function iterates over a list of namedtuple rows and inserts them into the database
-    using `insert_named_tuple`. It skips `None` values and logs failures if `log=True`.
+    This function inserts a list of namedtuple rows into the database. If one of them is 
+    rejected, the others are still inserted. It skips `None` values and logs failures if `log=True`.
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
@@ -517,7 +929,14 @@ def insert_named_tuples(
         None: This function does not return a value.
 
     Notes:
-        - Uses `insert_named_tuple` for each row.
+        - If the background `writer` is running, all rows are queued as **one unit**, 
+          which the writer wraps in a `SAVEPOINT` of its batch transaction.
+        - Otherwise, they are written right away in their own transaction.
+        - Either way, rows are **grouped by table** and inserted with multi-row statements 
+          (`INSERT ... VALUES (...), (...), ...`) in fixed-size chunks, plus one `executemany` 
+          for the leftover rows of each table (see `_insert_rows`).
+        - If an insert fails, the rows are retried one by one, and only the rejected ones are 
+          dropped (see `_write_units`).
         - Skips `None` values to prevent errors.
         - If `rows` is empty, the function exits early.
 
@@ -529,9 +948,24 @@ def insert_named_tuples(
         insert_named_tuples(get_connection, users)
         ```
     """
-    for row in rows:
-        if row is not None:
-            insert_named_tuple(get_connection, row, log=log, verbose=verbose)
+    rows = [row for row in rows if row is not None]
+    if not rows:
+        return
+
+    if writer is not None:
+        if verbose:
+            print(f'About to queue {len(rows)} rows')
+        writer.put(rows)
+        return
+
+    if verbose:
+        print(f'About to insert {len(rows)} rows')
+    con = get_connection()
+    con.isolation_level = None  # _write_units opens the transaction itself
+    try:
+        _write_units(con, [rows], log=log)
+    finally:
+        con.close()
         
 def log_event(get_connection: SQLite3ConnectionGenerator, **kwargs: Any) -> None:
     """
@@ -1,23 +1,118 @@
 
+import os
+import sys
 import time
+import queue
+import random
+import threading
+import atexit
+import logging
 import traceback
+import logging.handlers
 import requests as r
-from bs4 import BeautifulSoup
+import concurrent.futures
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 from . import db
 from . import globals as g
 from .types import SQLite3ConnectionGenerator, URL
 
-from typing import List, Dict, Any, Optional, Union, Tuple
+from pathlib import Path
+from urllib.parse import urlsplit
 
-__all__ = ['get_url_id','parse_url','insert_failed_url', 'get_tree_of_keys']
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable, Iterable
+
+__all__ = ['get_url_id','get_url_ids_bulk','get_session','fetch_url','parse_html','parse_url','insert_failed_url', 'get_tree_of_keys', 'error_message', 'execute_multi_thread_func', 'setup_logging']
+
+logger = logging.getLogger(__name__)
+
+# Scraping is I/O bound (HTTP + SQLite), so the pool is sized well above the number of cores
+DEFAULT_MAX_WORKERS = int((os.cpu_count() or 1) * 2.5)
+
+# Pitchfork is a single host behind a CDN: past a few dozen concurrent requests it starts
+# rate-limiting, which only adds timeouts and retries. Threads beyond this cap wait their turn
+MAX_REQUESTS_PER_HOST = 30
+REQUEST_JITTER = 0.1 # Upper bound (in seconds) of the random pause before each request
+
+# (connect, read) timeouts in seconds of each request, so a stalled connection fails and is 
+# retried instead of blocking its thread (and a slot of the host semaphore) forever
+REQUEST_TIMEOUT = (5, 30)
+
+# Pause between failed attempts of `fetch_url`: `RETRY_BACKOFF_BASE * 2**attempt` (never shorter than 
+# the caller's `timeout`), capped at `MAX_RETRY_DELAY`, +-20% of jitter. With 8 attempts the 7 pauses 
+# add up to about 90 s: 1-2 + 2 + 4 + 8 + 16 + 30 + 30
+RETRY_BACKOFF_BASE = 1
+MAX_RETRY_DELAY = 30
+RETRY_JITTER = 0.2
+
+# Statuses that won't change by asking again, so the URL isn't retried
+PERMANENT_FAILURE_STATUSES = frozenset({404, 410})
+
+# Sentinel of `dict_lookup` for missing keys, since `None` can be a legitimate JSON value
+MISSING = object()
+
+# BeautifulSoup backend for HTML pages: lxml's C tokenizer instead of the pure Python 'html.parser'
+HTML_PARSER = 'lxml'
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/50.0.2661.102 Safari/537.36'}
+
+def __create_session(pool_connections: int = 64, pool_maxsize: int = MAX_REQUESTS_PER_HOST) -> r.Session:
+    """
+    Creates the HTTP session shared by every scraper thread.
+
+    Pitchfork is scraped from a single host, so keeping the TCP+TLS connections 
+    alive between requests saves a handshake per URL.
+
+    Args:
+        pool_connections (int, optional): 
+            The number of host connection pools to cache. Defaults to `64`.
+        pool_maxsize (int, optional): 
+            The maximum number of connections kept alive per host. It must be at 
+            least as large as the number of concurrent requests per host. 
+            Defaults to `MAX_REQUESTS_PER_HOST`.
+
+    Returns:
+        requests.Session: A session with the custom User-Agent and a pooled adapter.
+
+    Notes:
+        - The adapter doesn't retry anything (`max_retries=0`): failed requests and error 
+          statuses are retried only by `fetch_url`, with its backoff, outside the host's slot.
+    """
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+
+    session = r.Session()
+    session.headers.update(HEADERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+session = __create_session()
+
+def get_session() -> r.Session:
+    """Returns the HTTP session shared by every scraper thread (see `__create_session`)."""
+    return session
+
+__host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+__host_semaphores_lock = threading.Lock()
+
+def __host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """
+    Returns the semaphore that caps the concurrent requests to the host of `url` 
+    at `MAX_REQUESTS_PER_HOST`, creating it on first use.
+    """
+    host = urlsplit(url).netloc
+    with __host_semaphores_lock:
+        if host not in __host_semaphores:
+            __host_semaphores[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return __host_semaphores[host]
 
 
 def get_url_id(url:str, return_isnew:bool=False) -> Union[int, Tuple[bool, int]]:
     """
     This function checks whether the provided `url` already has an assigned ID in 
     `g.urls_dict`. If not, it assigns a new unique ID and updates the dictionary. 
-    It ensures thread safety using `g.lock`.
+    `g.urls_dict` is a `TSCDict`, which makes this thread safe.
 
     Args:
         url (str): 
@@ -33,9 +128,14 @@ def get_url_id(url:str, return_isnew:bool=False) -> Union[int, Tuple[bool, int]]
                 - `is_new (bool)`: `True` if the URL was newly added, `False` otherwise.
                 - `url_id (int)`: The unique ID assigned to the URL.
 
+    Notes:
+        - `url` is interned (`sys.intern`), so the dictionary key and every row referring to 
+          the URL share one string, and later lookups can match the key by identity.
+
     Thread Safety:
-        - Uses `g.lock` to ensure that updates to `g.urls_dict` and `g.urls_id_counter` 
-          are atomic and avoid race conditions in multithreaded environments.
+        - URLs that already have an ID are read without locking (a single `dict.get` is atomic).
+        - New URLs take the `TSCDict`'s own lock, which makes assigning the ID atomic and 
+          doesn't hold back the lookups of other collections.
 
     Example:
         ```python
@@ -47,15 +147,36 @@ def get_url_id(url:str, return_isnew:bool=False) -> Union[int, Tuple[bool, int]]
         #          (True, 43) if it was newly assigned
         ```
     """
-    with g.lock:
-        is_new = url not in g.urls_dict
-        if is_new:
-            url_id = g.urls_id_counter
-            g.urls_dict[url] = url_id
-            g.urls_id_counter += 1
-        else:
-            url_id = g.urls_dict[url]
-        return (is_new, url_id) if return_isnew else url_id
+    # Most URLs (authors, artists) recur across reviews, so hits skip the lock (see `TSCDict`).
+    # Interning makes every copy of a URL share the string stored as the key
+    is_new, url_id = g.urls_dict[sys.intern(url)]
+    return (is_new, url_id) if return_isnew else url_id
+
+def get_url_ids_bulk(urls:List[str]) -> List[Tuple[bool, int]]:
+    """
+    Bulk version of `get_url_id(url, return_isnew=True)`: retrieves or assigns the IDs 
+    of all `urls` at once.
+
+    Args:
+        urls (List[str]): 
+            The URLs to retrieve or assign IDs for.
+
+    Returns:
+        List[Tuple[bool, int]]: An `(is_new, url_id)` tuple per URL, in the same order as `urls`.
+
+    Thread Safety:
+        - URLs that already have an ID are read without locking.
+        - All new URLs are assigned their IDs under a single acquisition of the `TSCDict`'s lock 
+          (see `TSCDict.get_many`), instead of one per URL.
+        - URLs are interned, as in `get_url_id`, so `g.urls_dict` keeps a single copy of each.
+
+    Example:
+        ```python
+        get_url_ids_bulk(["https://example.com", "https://example.org"])
+        # Returns: [(False, 42), (True, 43)] (example output)
+        ```
+    """
+    return g.urls_dict.get_many(sys.intern(url) for url in urls)
 
 def insert_failed_url(get_connection:SQLite3ConnectionGenerator, url_id:int, url:str) -> None:
     """
@@ -85,76 +206,167 @@ def insert_failed_url(get_connection:SQLite3ConnectionGenerator, url_id:int, url
     """
     db.insert_named_tuple(get_connection, URL(url_id, url))
 
-def parse_url(
+def fetch_url(
     get_connection: SQLite3ConnectionGenerator, 
     url: str, 
-    num_retrys: int = 20, 
+    num_retrys: int = 8, 
     timeout: float = 0.75, 
-    format: str = "xml",
-    ) -> BeautifulSoup | None:
+    ) -> r.Response | None:
     """
     This function attempts to retrieve a webpage using an HTTP GET request. If 
-    the request fails, it retries up to `num_retrys` times with a delay of 
-    `timeout` seconds between attempts. The function logs failed attempts 
+    the request fails, it retries up to `num_retrys` times, with an exponential 
+    backoff (at least `timeout` seconds) between attempts. The function logs failed attempts 
     and inserts failed URLs into the database when necessary.
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
             A function that returns an SQLite connection.
         url (str): 
-            The URL to fetch and parse.
+            The URL to fetch.
         num_retrys (int, optional): 
             The number of times to retry fetching the URL before giving up. 
-            Defaults to `20`.
+            Defaults to `8` (about a minute and a half of backoff).
         timeout (float, optional): 
-            The time (in seconds) to wait before retrying a failed request. 
-            Defaults to `0.75`.
-        format (str, optional): 
-            The parser format for `BeautifulSoup` (e.g., `"xml"`, `"html.parser"`). 
-            Defaults to `"xml"`.
+            The minimum time (in seconds) to wait before retrying a failed request. The backoff 
+            itself grows from `RETRY_BACKOFF_BASE` and doesn't depend on it. Defaults to `0.75`.
 
     Returns:
-        Optional[BeautifulSoup]: 
-            - A `BeautifulSoup` object if the page is successfully fetched.
+        Optional[requests.Response]: 
+            - The response if the page is successfully fetched (status code `200`).
             - `None` if all attempts fail.
 
     Notes:
         - Uses **a custom User-Agent** to avoid request blocking.
+        - Reuses the pooled keep-alive connections of the module-level `session`.
+        - Each request times out after `REQUEST_TIMEOUT` (connect, read) seconds and is retried; 
+          `timeout` is only the minimum pause between attempts.
+        - Every failed attempt, whether it raised or got a non-`200` status, is followed by the 
+          backoff pause; `404` and `410` (`PERMANENT_FAILURE_STATUSES`) aren't retried at all, and 
+          are logged with process `"Page not found"` instead, so they can be told apart from 
+          pages that may still be reachable later.
+        - At most `MAX_REQUESTS_PER_HOST` requests to the same host are in flight at once, 
+          and each one waits a random `0`-`REQUEST_JITTER` seconds first, so the threads 
+          don't hit the server in bursts.
         - If the URL is new, it is logged in the database on failure.
         - **Logs failures** using `log_event` with process `"Connection failed"`.
         - **Handles non-200 status codes** and logs them as errors.
+        - The body is downloaded inside the retry loop (and the host's slot), so a transfer 
+          that breaks halfway is retried like any other failed attempt.
 
     Example:
         ```python
-        soup = parse_url(get_connection, "https://example.com", format="html.parser")
-        if soup:
-            print(soup.prettify())
+        page = fetch_url(get_connection, "https://example.com/sitemap.xml")
+        if page:
+            data = page.content
         ```
     """
     page = None 
-    header = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/50.0.2661.102 Safari/537.36'}
 
     is_new, url_id = get_url_id(url, return_isnew=True)
     
     if is_new:
         db.insert_named_tuple(get_connection, URL(url_id, url))
 
-
-    for _ in range(num_retrys):
+    host_semaphore = __host_semaphore(url)
+    for attempt in range(num_retrys):
         try:
-            page = r.get(url, headers=header)
-            if page.status_code == 200:
-                break
-        except:
+            time.sleep(random.uniform(0, REQUEST_JITTER))
+            with host_semaphore:
+                page = session.get(url, timeout=REQUEST_TIMEOUT)
+        except Exception:
+            page = None
             message = traceback.format_exc()
             db.log_event(get_connection, url_id=url_id, process='Connection failed', success=0, message=message)
-            time.sleep(timeout)
+        else:
+            if page.status_code == 200:
+                return page
+            page.close() # Hand the connection back to the pool before retrying
+            if page.status_code in PERMANENT_FAILURE_STATUSES:
+                db.log_event(get_connection, url_id=url_id, process='Page not found', success=0, message=page.status_code)
+                return None
+        if attempt + 1 < num_retrys:
+            time.sleep(max(timeout, __retry_delay(attempt)))
+
+    # Only reached when every attempt failed
+    db.log_event(get_connection, url_id=url_id, process='Connection failed', success=0, message=page.status_code if page is not None else "No Response")
+    return None
+
+def __retry_delay(attempt: int) -> float:
+    """
+    Seconds to wait after the failed `attempt` (0-based) of `fetch_url`: exponential backoff 
+    from `RETRY_BACKOFF_BASE`, capped at `MAX_RETRY_DELAY`, with +-`RETRY_JITTER` of jitter 
+    so the threads don't retry in lockstep.
+    """
+    return min(MAX_RETRY_DELAY, RETRY_BACKOFF_BASE * 2 ** attempt) * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
+
+def parse_html(content: bytes, format: str = HTML_PARSER, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parses an already fetched page with `BeautifulSoup`.
+
+    Args:
+        content (bytes): 
+            The raw body of the page (e.g. `fetch_url(...).content`). Passing bytes 
+            lets the parser detect the encoding itself instead of decoding twice.
+        format (str, optional): 
+            The parser format for `BeautifulSoup`. Defaults to `HTML_PARSER`.
+        parse_only (Optional[SoupStrainer], optional): 
+            If given, only the matching tags are built into the tree. Defaults to `None`.
+
+    Returns:
+        BeautifulSoup: The parsed page.
+    """
+    return BeautifulSoup(content, features=format, parse_only=parse_only)
+
+def parse_url(
+    get_connection: SQLite3ConnectionGenerator, 
+    url: str, 
+    num_retrys: int = 8, 
+    timeout: float = 0.75, 
+    format: str = "xml",
+    parse_only: Optional[SoupStrainer] = None,
+    ) -> BeautifulSoup | None:
+    """
+    This function retrieves a webpage with `fetch_url()` and parses it with 
+    `BeautifulSoup`. Failed attempts are retried and logged by `fetch_url()`.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection.
+        url (str): 
+            The URL to fetch and parse.
+        num_retrys (int, optional): 
+            The number of times to retry fetching the URL before giving up. 
+            Defaults to `8` (about a minute and a half of backoff).
+        timeout (float, optional): 
+            The minimum time (in seconds) to wait before retrying a failed request 
+            (see `fetch_url`). Defaults to `0.75`.
+        format (str, optional): 
+            The parser format for `BeautifulSoup` (e.g., `"xml"`, `HTML_PARSER`). 
+            Defaults to `"xml"`.
+        parse_only (Optional[SoupStrainer], optional): 
+            If given, only the matching tags are built into the tree, which is much 
+            cheaper when just a few tags are needed. Defaults to `None` (whole page).
+
+    Returns:
+        Optional[BeautifulSoup]: 
+            - A `BeautifulSoup` object if the page is successfully fetched.
+            - `None` if all attempts fail.
 
-    if page is None or page.status_code != 200:
-        db.log_event(get_connection, url_id=url_id, process='Connection failed', success=0, message=page.status_code if page else "No Response")
+    Notes:
+        - See `fetch_url()` for the retry, rate-limiting and logging behavior.
+
+    Example:
+        ```python
+        soup = parse_url(get_connection, "https://example.com", format=HTML_PARSER)
+        if soup:
+            print(soup.prettify())
+        ```
+    """
+    page = fetch_url(get_connection, url, num_retrys=num_retrys, timeout=timeout)
+    if page is None:
         return None
     
-    return BeautifulSoup(page.content, features=format)
+    return parse_html(page.content, format=format, parse_only=parse_only)
 
 def dict_lookup(data_dict: Optional[Dict[str, Any]], keys_tree: List[str]) -> Optional[Any]:
     """
@@ -186,16 +398,169 @@ def dict_lookup(data_dict: Optional[Dict[str, Any]], keys_tree: List[str]) -> Op
     Notes:
         - If `data_dict` is `None` or empty, the function immediately returns `None`.
         - If `keys_tree` is empty, the function returns `None`.
-        - The function iterates through `keys_tree` and safely accesses dictionary values.
+        - The function iterates through `keys_tree` with one `dict.get` per level (instead of 
+          an `in` check followed by an indexing, which hashes every key twice).
+        - If a value along the path isn't a dictionary, the function returns `None`.
 
     """
-    if (data_dict is None) or (len(keys_tree) == 0) or (not data_dict):
+    if not data_dict or not keys_tree:
         return None
     
     result = data_dict
     for key in keys_tree:
-        if key in result:
-            result = result[key]
-        else:
+        result = result.get(key, MISSING) if isinstance(result, dict) else MISSING
+        if result is MISSING:
             return None
     return result
+
+def error_message(error: Exception, verbose: bool = False) -> str:
+    """
+    Formats a caught exception for `db.log_event()`. Formatting the full traceback is 
+    expensive and most failures are expected misses, so it is only done if `verbose`.
+
+    Args:
+        error (Exception): 
+            The exception being handled.
+        verbose (bool, optional): 
+            If `True`, returns the full `traceback.format_exc()`. Defaults to `False`.
+
+    Returns:
+        str: The traceback, or `"ExceptionType: message"`.
+    """
+    return traceback.format_exc() if verbose else f'{type(error).__name__}: {error}'
+
+def execute_multi_thread_func(
+    func: Callable[[Any], Any], 
+    params_list: Iterable[Any], 
+    max_workers: Optional[int] = None,
+    ) -> List[Any]:
+    """
+    This function runs `func` once per element of `params_list` on a thread pool. 
+    Tasks are submitted through a sliding window, so at most `4 * max_workers` 
+    futures exist at any time and `params_list` can be a lazy iterator.
+
+    Args:
+        func (Callable[[Any], Any]): 
+            The task to execute (e.g., `multithread_scrape_album`). It receives 
+            a single element of `params_list`.
+        params_list (Iterable[Any]): 
+            The inputs to map `func` over.
+        max_workers (Optional[int], optional): 
+            The number of worker threads. Defaults to `DEFAULT_MAX_WORKERS`.
+
+    Returns:
+        List[Any]: 
+            The elements of `params_list` whose task raised an exception.
+
+    Notes:
+        - Exceptions raised by `func` are **logged per task** instead of being silently 
+          dropped, and their inputs are returned so the caller can retry them.
+        - The pool is closed (and every task awaited) before the function returns.
+
+    Example:
+        ```python
+        failed_years = execute_multi_thread_func(multithread_scrape_year, range(1999, 2026), max_workers=32)
+        ```
+    """
+    max_workers = DEFAULT_MAX_WORKERS if max_workers is None else max_workers
+    max_pending = max_workers * 4
+    failed = []
+
+    def collect(done: Iterable[concurrent.futures.Future]) -> None:
+        for future in done:
+            params = pending.pop(future)
+            exception = future.exception()
+            if exception is not None:
+                logger.error("Error running %s on %s: %r", getattr(func, '__name__', func), params, exception)
+                failed.append(params)
+
+    pending = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for params in params_list:
+            if len(pending) >= max_pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                collect(done)
+            pending[executor.submit(func, params)] = params
+
+        collect(concurrent.futures.as_completed(list(pending)))
+
+    return failed
+
+__log_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging(
+    filename: str = 'scraper.log', 
+    filepath: Union[str, Path] = 'data', 
+    level: int = logging.INFO, 
+    console_level: int = logging.WARNING,
+    max_bytes: int = 10 * 2**20,
+    backup_count: int = 5) -> None:
+    """
+    Routes every log record through a queue to a rotating log file and the console.
+
+    Scraping threads only put records on an in-memory queue; a background 
+    `QueueListener` formats them and does the file/terminal I/O. This keeps the 
+    worker threads from serializing on the stdout lock, as they would with `print`.
+
+    Args:
+        filename (str, optional): 
+            The name of the log file. Defaults to `'scraper.log'`.
+        filepath (Union[str, Path], optional): 
+            The directory of the log file, created if missing. Defaults to `'data'`.
+        level (int, optional): 
+            The minimum level written to the log file. Defaults to `logging.INFO`.
+        console_level (int, optional): 
+            The minimum level echoed to the terminal. Defaults to `logging.WARNING`, 
+            so per-URL progress only goes to the file.
+        max_bytes (int, optional): 
+            The size (in bytes) at which the log file is rotated. Defaults to 10 MiB.
+        backup_count (int, optional): 
+            The number of rotated log files kept. Defaults to `5`.
+
+    Returns:
+        None: This function does not return a value.
+
+    Notes:
+        - Calling it again replaces the previous configuration.
+        - The listener is stopped with `atexit`, which flushes the records still queued.
+
+    Example:
+        ```python
+        setup_logging(level=logging.DEBUG)
+        logging.getLogger(__name__).info('Scraping year %s', 2025)
+        ```
+    """
+    global __log_listener
+    if __log_listener is not None:
+        __log_listener.stop()
+
+    filepath = Path(filepath)
+    filepath.mkdir(parents=True, exist_ok=True)
+
+    formatter = logging.Formatter('%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s')
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        filepath / filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Only merge the args, the listener formats the line
+    logging.basicConfig(level=min(level, console_level), handlers=[queue_handler], force=True)
+
+    __log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True)
+    __log_listener.start()
+
+def __stop_logging() -> None:
+    global __log_listener
+    if __log_listener is not None:
+        __log_listener.stop()
+        __log_listener = None
+
+atexit.register(__stop_logging)
@@ -1,21 +1,81 @@
 
+import io
 import traceback
 import requests as r
 import datetime as dt
 from dateutil import parser
+from lxml import etree
 from bs4 import BeautifulSoup
 
 from . import db
 from . import general
 from . import album
 from .types import SQLite3ConnectionGenerator, URL
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Iterator, IO
 
 __all__ = [
-    'get_weekly_urls_in_a_year', 'get_urls_inside_a_weekly_url', 
+    'iter_sitemap_locs', 'get_weekly_urls_in_a_year', 'get_urls_inside_a_weekly_url', 
     'scrape_sitemap_year', 'scrape_sitemap_year_range',]
 
 ## Sitemap Scraping
+SITEMAP_LOC_TAG = '{*}loc' # <loc> in any namespace (sitemaps use http://www.sitemaps.org/schemas/sitemap/0.9)
+
+# Weekly sitemaps of a year fetched at once. Years are scraped in parallel too, and 
+# `general.MAX_REQUESTS_PER_HOST` caps the requests actually in flight
+WEEKLY_SITEMAP_WORKERS = 8
+
+def __iterparse_locs(source: IO[bytes]) -> Iterator[str]:
+    """
+    Yields the text of every `<loc>` element of a sitemap, as it is parsed from `source`.
+
+    Each `<loc>` (and the `<url>`/`<sitemap>` entries before it) is freed once read, 
+    so memory stays flat no matter how many entries the sitemap has.
+    """
+    for _, elem in etree.iterparse(source, events=('end',), tag=SITEMAP_LOC_TAG):
+        if elem.text:
+            yield elem.text.strip()
+        entry = elem.getparent()
+        elem.clear()
+        if entry is None:
+            continue
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
+
+def iter_sitemap_locs(get_connection:SQLite3ConnectionGenerator, url:str, timeout:float=0.5) -> Iterator[str]:
+    """
+    Yields the URLs listed in a sitemap (or sitemap index) page.
+
+    Args:
+        get_connection (SQLite3ConnectionGenerator): 
+            A function that returns an SQLite connection.
+        url (str): 
+            The sitemap URL.
+        timeout (float, optional): 
+            The timeout in seconds before retrying a failed request. 
+            Defaults to `0.5`.
+
+    Returns:
+        Iterator[str]: 
+            The text of every `<loc>` element. Yields nothing if the request fails.
+
+    Notes:
+        - The body is downloaded by `general.fetch_url()`, inside its retry loop: sitemaps are 
+          small, and a read timeout or a connection dropped halfway is retried like any failed request.
+        - It is then parsed with `lxml.etree.iterparse`, which frees every entry once read, 
+          instead of building the whole document tree first.
+
+    Example:
+        ```python
+        for loc in iter_sitemap_locs(get_connection, 'https://pitchfork.com/sitemap.xml?year=2024'):
+            print(loc)
+        ```
+    """
+    page = general.fetch_url(get_connection, url=url, timeout=timeout)
+    if page is None:
+        return
+
+    yield from __iterparse_locs(io.BytesIO(page.content))
+
 def get_album_url_dates(soup:Optional[BeautifulSoup]):
     json_ld = album.extract_json_linked_data_album(soup)
     d = parser.isoparse(json_ld['datePublished'])
@@ -50,7 +110,7 @@ def get_weekly_urls_in_a_year(get_connection:SQLite3ConnectionGenerator, year:in
         ```
 
     Notes:
-        - Calls `general.parse_url()` to fetch the sitemap page.
+        - Calls `iter_sitemap_locs()` to fetch and parse the sitemap page.
         - If the request fails, the function returns an **empty list** instead of `None`.
         - The function extracts all `<loc>` elements, which contain the URLs.
     """
@@ -60,16 +120,13 @@ def get_weekly_urls_in_a_year(get_connection:SQLite3ConnectionGenerator, year:in
     # is_new, url_id = blah blah
     # insert_named_tuple(URL(blah blah))
 
-    soup = general.parse_url(get_connection, timeout=timeout, url=url)
-    if soup is None:
-        return []
-    return [url.text for url in soup.find_all('loc')]
+    return list(iter_sitemap_locs(get_connection, url, timeout=timeout))
 
-def get_urls_inside_a_weekly_url(get_connection:SQLite3ConnectionGenerator, weekly_url:str, timeout:float=0.5) -> None:
+def get_urls_inside_a_weekly_url(get_connection:SQLite3ConnectionGenerator, weekly_url:str, timeout:float=0.5) -> List[URL]:
     """
     This function fetches a **weekly sitemap page** from Pitchfork, extracts 
     all URLs listed within it, and converts them into `URL` namedtuples 
-    that will be inserted into the database.
+    to be inserted into the database by the caller.
 
     Args:
         get_connection (SQLite3ConnectionGenerator): 
@@ -80,23 +137,22 @@ def get_urls_inside_a_weekly_url(get_connection:SQLite3ConnectionGenerator, week
             The timeout in seconds before retrying a failed request. 
             Defaults to `0.5`.
 
-    Returns: None
+    Returns:
+        List[URL]: The URLs that didn't have an ID yet (only those need to be inserted).
 
     Notes:
-        - Calls `general.parse_url()` to fetch and parse the sitemap.
-        - Uses `general.get_url_id()` to assign a unique ID to each extracted URL.s
+        - Calls `iter_sitemap_locs()` to fetch and parse the sitemap.
+        - Uses `general.get_url_ids_bulk()` to assign the IDs of the whole week at once.
+        - Nothing is inserted here: `scrape_sitemap_year()` inserts them.
     """
 
-    soup = general.parse_url(get_connection, timeout=timeout, url=weekly_url)
-    if not soup:
-        return 
-
-    urls_raw = [u.text for u in soup.find_all('loc')]
-    urls = [URL(general.get_url_id(u), u) for u in urls_raw]
-    db.insert_named_tuples(get_connection, urls)
+    locs = list(iter_sitemap_locs(get_connection, weekly_url, timeout=timeout))
+    return [
+        URL(url_id, u) for u, (is_new, url_id) in zip(locs, general.get_url_ids_bulk(locs)) 
+        if is_new] # Urls already in the database (e.g. when resuming a run) aren't inserted twice
 
 def parse_album_url(get_connection:SQLite3ConnectionGenerator, url:str, timeout:float=0.5) -> URL:
-        soup = general.parse_url(get_connection, timeout=timeout, url=url, format='html.parser')
+        soup = general.parse_url(get_connection, timeout=timeout, url=url, format=general.HTML_PARSER)
         return None if (soup is None) else URL(general.get_url_id(url), url)
 
 def scrape_sitemap_year(get_connection:SQLite3ConnectionGenerator, year:int, timeout:float=0.5) -> None:
@@ -118,7 +174,10 @@ def scrape_sitemap_year(get_connection:SQLite3ConnectionGenerator, year:int, tim
 
     Process:
         - Calls `get_weekly_urls_in_a_year()` to get all weekly sitemap URLs.
-        - Calls `get_urls_inside_a_weekly_url()` for each weekly URL to extract page URLs.
+        - Calls `get_urls_inside_a_weekly_url()` for each weekly URL to extract page URLs, 
+          `WEEKLY_SITEMAP_WORKERS` weeks at a time (`general.execute_multi_thread_func()`).
+        - Inserts the new URLs of each week with one `db.insert_named_tuples()` call: every week 
+          is its own unit of the writer's batch, so a failed insert only loses that week.
         - Logs any exceptions that occur during the scraping process.
 
     Example:
@@ -128,7 +187,6 @@ def scrape_sitemap_year(get_connection:SQLite3ConnectionGenerator, year:int, tim
 
     Notes:
         - If an error occurs, it logs the exception using `db.log_event()`.
-        - Uses **list concatenation (`urls += ...`)** to collect URLs before insertion.
         - The function **does not return** any data; it writes directly to the database.
 
     Raises:
@@ -136,8 +194,14 @@ def scrape_sitemap_year(get_connection:SQLite3ConnectionGenerator, year:int, tim
     """
 
     try:
-        for weekly_url in get_weekly_urls_in_a_year(get_connection, year, timeout=timeout):
-            get_urls_inside_a_weekly_url(get_connection, weekly_url, timeout=timeout)
+        weekly_urls = get_weekly_urls_in_a_year(get_connection, year, timeout=timeout)
+        def scrape_week(weekly_url: str) -> None:
+            db.insert_named_tuples(get_connection, get_urls_inside_a_weekly_url(get_connection, weekly_url, timeout=timeout))
+
+        failed_weeks = general.execute_multi_thread_func(scrape_week, weekly_urls, max_workers=WEEKLY_SITEMAP_WORKERS)
+
+        for weekly_url in failed_weeks:
+            db.log_event(get_connection, process=f"Error scraping year {year}", success=0, message=f"Failed at weekly sitemap {weekly_url}")
     except Exception as e:
         message = traceback.format_exc()
         db.log_event(get_connection, process=f"Error scraping year {year}", success=0, message=message)
@@ -3,42 +3,52 @@ from __future__ import annotations
 import pytz
 import sqlite3
 import threading
+import itertools
 import datetime as dt
 
-from typing import Callable, Union, NamedTuple, Dict,Any
-from collections import namedtuple
+from typing import Callable, Union, NamedTuple, Dict, Any, Optional, Tuple, Iterator, Iterable, List
 
 
 namedtuples = ['URL', 'Label', 'Genre', 'Keyword', 'Entity', 'Artist', 'Album', 'Review', 
 'Review_Labels', 'Review_Authors', 'Review_Artists', 'Review_Entities', 'Review_Keywords', 'Review_Albums', 'Review_Artist_Genres', 
 'Author', 'Author_Bio', 'Author_Type', 'Author_Type_Evolution', 'scraping_events']
 
-__all__ = namedtuples + ['SQLite3ConnectionGenerator', 'DatabaseRow']
+__all__ = namedtuples + ['SQLite3ConnectionGenerator', 'DatabaseRow', 'TSCDict']
 
-URL = namedtuple('urls', ['url_id', 'url',])
+# Row types: the name given to `NamedTuple` is the table the rows are inserted into, 
+# and the field names are its columns (see `db.insert_named_tuples`)
+URL = NamedTuple('urls', [('url_id', int), ('url', str)])
 
-Label = namedtuple('labels', ['label_id', 'label'])
-Genre = namedtuple('genres', ['genre_id', 'genre'])
-Keyword = namedtuple('keywords', ['keyword_id', 'keyword',])
-Entity = namedtuple('entities', ['entity_id', 'entity',])
+Label = NamedTuple('labels', [('label_id', int), ('label', Optional[str])])
+Genre = NamedTuple('genres', [('genre_id', int), ('genre', Optional[str])])
+Keyword = NamedTuple('keywords', [('keyword_id', int), ('keyword', Optional[str])])
+Entity = NamedTuple('entities', [('entity_id', int), ('entity', Optional[str])])
 
-Artist = namedtuple('artists', ['artist_id', 'artist', 'url_id',])
-Album = namedtuple('albums', ['album_id', 'album', 'publisher', 'release_year', 'pitchfork_score', 'is_best_new_music', 'is_best_new_reissue'])
-Review = namedtuple('reviews', ['review_id', 'revisions', 'url_id', 'body', 'description', 'date_pub', 'date_mod'])
+Artist = NamedTuple('artists', [('artist_id', int), ('artist', Optional[str]), ('url_id', int)])
+Album = NamedTuple('albums', [
+    ('album_id', str), ('album', Optional[str]), ('publisher', Optional[str]), ('release_year', Optional[int]), 
+    ('pitchfork_score', Optional[int]), ('is_best_new_music', int), ('is_best_new_reissue', int)])
+Review = NamedTuple('reviews', [
+    ('review_id', str), ('revisions', Optional[int]), ('url_id', int), ('body', Optional[str]), 
+    ('description', Optional[str]), ('date_pub', Optional[str]), ('date_mod', Optional[str])])
 
-Review_Labels = namedtuple('review_labels', ['review_id', 'label_id'])
-Review_Authors = namedtuple('review_authors', ['review_id', 'author_id'])
-Review_Artists =  namedtuple('review_artists', ['review_id', 'artist_id'])
-Review_Entities = namedtuple('review_entities', ['review_id', 'entity_id', 'score'])
-Review_Keywords = namedtuple('review_keywords', ['review_id', 'keyword_id', 'score'])
-Review_Albums = namedtuple('review_albums', ['review_id', 'album_id'])
+Review_Labels = NamedTuple('review_labels', [('review_id', str), ('label_id', int)])
+Review_Authors = NamedTuple('review_authors', [('review_id', str), ('author_id', str)])
+Review_Artists = NamedTuple('review_artists', [('review_id', str), ('artist_id', int)])
+Review_Entities = NamedTuple('review_entities', [('review_id', str), ('entity_id', int), ('score', Optional[float])])
+Review_Keywords = NamedTuple('review_keywords', [('review_id', str), ('keyword_id', int), ('score', Optional[float])])
+Review_Albums = NamedTuple('review_albums', [('review_id', str), ('album_id', str)])
 
-Review_Artist_Genres =  namedtuple('review_artist_genres', ['review_id', 'artist_id', 'genre_id'])
+Review_Artist_Genres = NamedTuple('review_artist_genres', [('review_id', str), ('artist_id', int), ('genre_id', int)])
 
-Author = namedtuple('authors', ['author_id','author','url_id'])
-Author_Bio = namedtuple('author_bios', ['author_id', 'date_pub', 'revisions', 'bio'])
-Author_Type = namedtuple('author_types', ['author_type_id','author_type'])
-Author_Type_Evolution = namedtuple('author_type_evolution', ['author_id', 'author_type1_id', 'author_type2_id', 'as_of_date', ])
+Author = NamedTuple('authors', [('author_id', str), ('author', Optional[str]), ('url_id', int)])
+Author_Bio = NamedTuple('author_bios', [('author_id', str), ('date_pub', Optional[str]), ('revisions', Optional[int]), ('bio', Optional[str])])
+Author_Type = NamedTuple('author_types', [('author_type_id', int), ('author_type', Optional[str])])
+Author_Type_Evolution = NamedTuple('author_type_evolution', [
+    ('author_id', str), ('author_type1_id', int), ('author_type2_id', int), ('as_of_date', Optional[str])])
+
+# Timezone of the `scraping_events` timestamps, built once instead of on every event
+VIENNA_TZ = pytz.timezone("Europe/Vienna")
 
 class scraping_events(NamedTuple):
     timestamp: dt.datetime
@@ -49,7 +59,7 @@ class scraping_events(NamedTuple):
 
     @staticmethod
     def default_timestamp():
-        return dt.datetime.now(pytz.timezone("Europe/Vienna")).isoformat()
+        return dt.datetime.now(VIENNA_TZ).isoformat()
 
 DatabaseRow = Union[
     URL, Label, Genre, Keyword, Entity, Artist, Album, Review,
@@ -58,4 +68,89 @@ DatabaseRow = Union[
     Author, Author_Bio, Author_Type, Author_Type_Evolution, None
 ]
 
-SQLite3ConnectionGenerator = Callable[[], 'sqlite3.Connection']
\ No newline at end of file
+SQLite3ConnectionGenerator = Callable[..., 'sqlite3.Connection']
+
+class TSCDict:
+    """
+    Thread-Safe Counter Dictionary: assigns sequential integer IDs to keys.
+
+    Looking up a key returns its ID, assigning the next free one if the key is new. 
+    It replaces the `dict` + `counter` + `lock` triplets the scrapers used to update by hand.
+
+    Args:
+        initial_data (Optional[Dict[Any, int]], optional): 
+            Existing `key -> id` pairs (e.g. loaded from the database). The next ID 
+            assigned is one above the largest one in it. Defaults to `{None: 0}`, the 
+            "null" row every lookup table starts with.
+
+    Example:
+        ```python
+        labels = TSCDict()
+        labels['Sub Pop']   # (True, 1): new key, new ID
+        labels['Sub Pop']   # (False, 1)
+        'Sub Pop' in labels # True
+        ```
+
+    Notes:
+        - Lookups use **double-checked locking**: a key that already exists is read without 
+          taking the lock (dict reads are atomic under the GIL), and only a missing key takes 
+          the lock, checks again and inserts. After warm-up almost every lookup is lock-free.
+        - IDs are never reused or reassigned.
+    """
+    def __init__(self, initial_data: Optional[Dict[Any, int]] = None):
+        self.__data = {None: 0} if initial_data is None else dict(initial_data)
+        self.__counter = itertools.count(max(self.__data.values(), default=0) + 1) # next() bumps it in C
+        self.__lock = threading.Lock()
+
+    def __getitem__(self, key: Any) -> Tuple[bool, int]:
+        """Returns `(is_new, id)` for `key`, assigning the next ID if `key` is new."""
+        value = self.__data.get(key)
+        if value is not None:
+            return False, value
+
+        with self.__lock:
+            value = self.__data.get(key)  # Another thread may have inserted it in the meantime
+            if value is not None:
+                return False, value
+            value = next(self.__counter)
+            self.__data[key] = value
+            return True, value
+
+    def get_many(self, keys: Iterable[Any]) -> List[Tuple[bool, int]]:
+        """
+        Returns `(is_new, id)` for every key in `keys`, in order, like `self[key]` would.
+
+        Existing keys are read without locking, and all the missing ones are assigned their 
+        IDs under a **single** lock acquisition, instead of one per key.
+        """
+        keys = list(keys)
+        values = [self.__data.get(key) for key in keys]
+        if all(value is not None for value in values):
+            return [(False, value) for value in values]
+
+        results = []
+        with self.__lock:
+            for key, value in zip(keys, values):
+                if value is None:
+                    value = self.__data.get(key)  # Another thread (or an earlier duplicate in `keys`) may have inserted it
+                if value is not None:
+                    results.append((False, value))
+                    continue
+                value = next(self.__counter)
+                self.__data[key] = value
+                results.append((True, value))
+        return results
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__data
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def items(self) -> Iterator[Tuple[Any, int]]:
+        """Returns a snapshot of the `(key, id)` pairs."""
+        with self.__lock:
+            return iter(list(self.__data.items()))
+
+    def __repr__(self) -> str:
+        return f"TSCDict({len(self)} keys, id {self.__counter!r})"